@@ -0,0 +1,166 @@
+"""
+Generators for the synthetic document models and documents used by the benchmark suite.
+
+The shape of a model is described by a :class:`DocumentShape`. Each level of the
+document is a :class:`~wysdom.UserObject` with `breadth` primitive properties, an
+enum property with `enum_size` members, a polymorphic property whose base class
+has `fan_out` registered subclasses and, except at the deepest level, a list of
+`list_length` objects of the next level.
+"""
+
+from typing import Any, Dict, List, NamedTuple, Type
+
+from enum import Enum
+
+from wysdom import UserObject, UserProperty, ListProperty, SchemaConst
+from wysdom.mixins import ReadsJSON, ReadsYAML, RegistersSubclasses
+
+
+class DocumentShape(NamedTuple):
+    """
+    The dimensions of a synthetic document.
+
+    :param breadth:       The number of primitive properties of each object.
+    :param depth:         The number of levels of nested objects below the root object.
+    :param list_length:   The number of child objects of each object above the deepest level.
+    :param fan_out:       The number of registered subclasses of the polymorphic property.
+    :param enum_size:     The number of members of the enum property.
+    :param discriminated: If True, the subclasses of the polymorphic property can be
+                          told apart by a constant `kind` property.
+    """
+
+    breadth: int = 4
+    depth: int = 3
+    list_length: int = 4
+    fan_out: int = 4
+    enum_size: int = 8
+    discriminated: bool = True
+
+    @property
+    def node_count(self) -> int:
+        """
+        The number of objects in a document of this shape, excluding polymorphic properties.
+        """
+        return sum(self.list_length**level for level in range(self.depth + 1))
+
+
+class DocumentModel(NamedTuple):
+    """
+    The classes generated for a :class:`DocumentShape`.
+
+    :param root:    The class of the root object of the document.
+    :param variant: The base class of the polymorphic property.
+    :param status:  The enum used by the enum property.
+    """
+
+    root: Type[UserObject]
+    variant: Type[UserObject]
+    status: Type[Enum]
+
+
+_FIELD_TYPES = (str, int, float, bool)
+
+
+def build_model(shape: DocumentShape, prefix: str) -> DocumentModel:
+    """
+    Declare the classes for documents of a given shape.
+
+    :param shape:  The shape of the documents.
+    :param prefix: A prefix for the class names, which must be unique for each model.
+    :return:       The generated classes.
+    """
+    status = Enum(
+        f"{prefix}Status",
+        {f"VALUE_{i}": f"value_{i}" for i in range(shape.enum_size)},
+        module=__name__,
+    )
+    variant = type(
+        f"{prefix}Variant",
+        (UserObject, RegistersSubclasses),
+        {"__module__": __name__, "__slots__": (), "name": UserProperty(str)},
+    )
+    for k in range(shape.fan_out):
+        namespace = {
+            "__module__": __name__,
+            "__slots__": (),
+            f"value_{k}": UserProperty(int),
+        }
+        if shape.discriminated:
+            namespace["kind"] = UserProperty(SchemaConst(f"kind_{k}"))
+        type(f"{prefix}Variant{k}", (variant,), namespace)
+    child = None
+    for level in reversed(range(shape.depth + 1)):
+        namespace = {
+            "__module__": __name__,
+            "__slots__": (),
+            "status": UserProperty(status),
+            "variant": UserProperty(variant),
+        }
+        for i in range(shape.breadth):
+            namespace[f"field_{i}"] = UserProperty(_FIELD_TYPES[i % len(_FIELD_TYPES)])
+        if child is not None:
+            namespace["children"] = ListProperty(child)
+        bases = (UserObject, ReadsJSON, ReadsYAML) if level == 0 else (UserObject,)
+        child = type(f"{prefix}Node{level}", bases, namespace)
+    return DocumentModel(root=child, variant=variant, status=status)
+
+
+def build_variant(shape: DocumentShape, n: int) -> Dict[str, Any]:
+    """
+    Generate the data for a polymorphic property, cycling through its subclasses.
+
+    :param shape: The shape of the document.
+    :param n:     A sequence number used to choose the subclass and generate values.
+    :return:      The data for the property.
+    """
+    k = n % shape.fan_out
+    variant = {"name": f"variant {n}", f"value_{k}": n}
+    if shape.discriminated:
+        variant["kind"] = f"kind_{k}"
+    return variant
+
+
+def build_document(shape: DocumentShape) -> Dict[str, Any]:
+    """
+    Generate the data for a document of a given shape.
+
+    :param shape: The shape of the document.
+    :return:      The data for the root object of the document.
+    """
+    counter = iter(range(shape.node_count))
+
+    def build_node(level: int) -> Dict[str, Any]:
+        n = next(counter)
+        node = {
+            "status": f"value_{n % shape.enum_size}",
+            "variant": build_variant(shape, n),
+        }
+        for i in range(shape.breadth):
+            field_type = _FIELD_TYPES[i % len(_FIELD_TYPES)]
+            if field_type is str:
+                node[f"field_{i}"] = f"text {n}"
+            elif field_type is int:
+                node[f"field_{i}"] = n
+            elif field_type is float:
+                node[f"field_{i}"] = n + 0.5
+            else:
+                node[f"field_{i}"] = n % 2 == 0
+        if level < shape.depth:
+            node["children"] = [build_node(level + 1) for _ in range(shape.list_length)]
+        return node
+
+    return build_node(0)
+
+
+def document_nodes(document: UserObject) -> List[UserObject]:
+    """
+    List the objects in a document, excluding polymorphic properties.
+
+    :param document: The root object of a generated document.
+    :return:         The root object and all of its descendants.
+    """
+    nodes = [document]
+    for node in nodes:
+        if "children" in node:
+            nodes.extend(node["children"])
+    return nodes
@@ -0,0 +1,66 @@
+"""
+Measures the memory overhead of each DOM node in a large wysdom document.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.memory [--nodes NODES]
+
+The input data is created before measurement starts, so the figures reported
+are for the DOM elements only, and not for the raw data they are created from.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from wysdom import UserObject, UserProperty, ListProperty, DictProperty
+
+
+class Item(UserObject):
+    __slots__ = ()
+
+    id: int = UserProperty(int)
+    labels = DictProperty(str)
+
+
+class Document(UserObject):
+    __slots__ = ()
+
+    items = ListProperty(Item)
+
+
+def build_input(records: int) -> dict:
+    return {"items": [{"id": i, "labels": {"name": "item"}} for i in range(records)]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Each record creates two nodes: an Item and the DOMDict for its labels
+    records = args.nodes // 2
+    input_data = build_input(records)
+    node_count = 2 * records + 2
+
+    gc.collect()
+    tracemalloc.start()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    start_time = time.perf_counter()
+    document = Document(input_data)
+    elapsed = time.perf_counter() - start_time
+    gc.collect()
+    end_memory, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"DOM nodes:          {node_count}")
+    print(f"Construction time:  {elapsed:.2f}s")
+    print(f"Memory used:        {(end_memory - start_memory) / 2 ** 20:.1f} MiB")
+    print(f"Peak memory:        {(peak_memory - start_memory) / 2 ** 20:.1f} MiB")
+    print(f"Bytes per node:     {(end_memory - start_memory) / node_count:.1f}")
+    assert len(document.items) == records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compares building many UserObjects with UserObject.from_records against
+calling the class constructor in a loop.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.records [--records RECORDS] [--repeat REPEAT] [--processes PROCESSES]
+
+With --processes, records are also validated by a pool of worker processes.
+"""
+
+import argparse
+import time
+from functools import partial
+
+from wysdom import UserObject, UserProperty, ListProperty, DictProperty
+
+
+class Address(UserObject):
+    __slots__ = ()
+
+    first_line: str = UserProperty(str)
+    city: str = UserProperty(str)
+    postal_code: int = UserProperty(int)
+
+
+class Person(UserObject):
+    __slots__ = ()
+
+    first_name: str = UserProperty(str)
+    last_name: str = UserProperty(str)
+    addresses = ListProperty(Address)
+    labels = DictProperty(str)
+
+
+def build_input(records: int) -> list:
+    return [
+        {
+            "first_name": f"first_name_{i}",
+            "last_name": f"last_name_{i}",
+            "addresses": [
+                {
+                    "first_line": f"{i} Fake Street",
+                    "city": "Springfield",
+                    "postal_code": i,
+                }
+            ],
+            "labels": {"id": str(i)},
+        }
+        for i in range(records)
+    ]
+
+
+def naive_loop(input_data: list) -> list:
+    return [Person(record) for record in input_data]
+
+
+def from_records(input_data: list) -> list:
+    return Person.from_records(input_data)
+
+
+def from_records_lazy(input_data: list) -> list:
+    return Person.from_records(input_data, lazy=True)
+
+
+def from_records_parallel(input_data: list, processes: int) -> list:
+    return Person.from_records(input_data, processes=processes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    input_data = build_input(args.records)
+    functions = [naive_loop, from_records, from_records_lazy]
+    if args.processes:
+        functions.append(partial(from_records_parallel, processes=args.processes))
+    for function in functions:
+        timings = []
+        for _ in range(args.repeat):
+            start_time = time.perf_counter()
+            result = function(input_data)
+            timings.append(time.perf_counter() - start_time)
+            assert len(result) == args.records
+        print(
+            f"{getattr(function, 'func', function).__name__ + ':':24}{min(timings):.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
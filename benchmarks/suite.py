@@ -0,0 +1,405 @@
+"""
+Times the main operations of wysdom on synthetic documents of several shapes.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.suite [--shapes SHAPE ...] [--cases CASE ...]
+                               [--min-time SECONDS] [--repeat REPEAT]
+                               [--output REPORT] [--compare BASELINE]
+
+Each case is timed on a document of each shape, and the fastest and median
+time per call are reported. With --output, the results are also written to a
+JSON report, which can be compared with the results of another run (e.g. of a
+different version of wysdom) using --compare. To benchmark another copy of
+wysdom with this suite, run it from outside the repository with that copy
+first on the Python path::
+
+    PYTHONPATH=/path/to/other/wysdom:/path/to/this/repository python -m benchmarks.suite
+
+Cases that use features that are not available in the version of wysdom being
+benchmarked are skipped.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import argparse
+import copy
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from collections import deque
+from operator import attrgetter
+
+import wysdom
+from wysdom import schema
+
+from benchmarks.generators import (
+    DocumentShape,
+    DocumentModel,
+    build_model,
+    build_document,
+    build_variant,
+    document_nodes,
+)
+
+# Lazy construction from a dict is only available through wysdom's private
+# build information, which older versions do not have
+_BuildInfo = getattr(
+    importlib.import_module("wysdom.dom.DOMElement"), "_BuildInfo", None
+)
+
+SHAPES: Dict[str, DocumentShape] = {
+    "default": DocumentShape(),
+    "wide": DocumentShape(breadth=32),
+    "deep": DocumentShape(depth=8, list_length=2),
+    "long_lists": DocumentShape(depth=1, list_length=1000),
+    "fan_out": DocumentShape(fan_out=32),
+    "fan_out_undiscriminated": DocumentShape(fan_out=32, discriminated=False),
+    "large_enum": DocumentShape(enum_size=256),
+}
+
+
+class Fixture(NamedTuple):
+    """
+    The data and objects that a benchmark case is run against.
+    """
+
+    shape: DocumentShape
+    model: DocumentModel
+    data: Dict[str, Any]
+    variants: List[Dict[str, Any]]
+
+
+# Benchmark cases, each of which returns the function to time for a fixture
+CASES: Dict[str, Callable[[Fixture], Callable[[], Any]]] = {}
+
+# The feature of wysdom needed by each case that does not work with all versions,
+# and a function that determines whether a fixture's model has that feature
+REQUIREMENTS: Dict[str, Tuple[str, Callable[[Fixture], bool]]] = {}
+
+
+def case(
+    name: str, requires: Optional[Tuple[str, Callable[[Fixture], bool]]] = None
+) -> Callable:
+    def register(function: Callable[[Fixture], Callable[[], Any]]) -> Callable:
+        CASES[name] = function
+        if requires is not None:
+            REQUIREMENTS[name] = requires
+        return function
+
+    return register
+
+
+def has_lazy_construction(fixture: Fixture) -> bool:
+    return _BuildInfo is not None
+
+
+def has_from_trusted(fixture: Fixture) -> bool:
+    return hasattr(fixture.model.root, "from_trusted")
+
+
+def has_json_cache(fixture: Fixture) -> bool:
+    return "cache" in inspect.signature(fixture.model.root.to_json).parameters
+
+
+@case("construct")
+def construct(fixture: Fixture) -> Callable[[], Any]:
+    return lambda: fixture.model.root(fixture.data)
+
+
+@case("construct_lazy", requires=("lazy construction", has_lazy_construction))
+def construct_lazy(fixture: Fixture) -> Callable[[], Any]:
+    return lambda: fixture.model.root(fixture.data, _BuildInfo(lazy=True))
+
+
+@case("construct_trusted", requires=("from_trusted", has_from_trusted))
+def construct_trusted(fixture: Fixture) -> Callable[[], Any]:
+    return lambda: fixture.model.root.from_trusted(fixture.data)
+
+
+@case("is_valid")
+def is_valid(fixture: Fixture) -> Callable[[], Any]:
+    root_schema = schema(fixture.model.root)
+    return lambda: root_schema.is_valid(fixture.data)
+
+
+@case("validate")
+def validate(fixture: Fixture) -> Callable[[], Any]:
+    root_schema = schema(fixture.model.root)
+    return lambda: root_schema.validate(fixture.data)
+
+
+@case("anyof_dispatch")
+def anyof_dispatch(fixture: Fixture) -> Callable[[], Any]:
+    variant_schema = schema(fixture.model.variant)
+    variants = fixture.variants
+
+    def run() -> None:
+        for variant in variants:
+            variant_schema(variant)
+
+    return run
+
+
+@case("enum_conversion")
+def enum_conversion(fixture: Fixture) -> Callable[[], Any]:
+    status_schema = wysdom.properties(fixture.model.root)["status"]
+    values = [member.value for member in fixture.model.status]
+
+    def run() -> None:
+        for value in values:
+            status_schema(value)
+
+    return run
+
+
+@case("property_get")
+def property_get(fixture: Fixture) -> Callable[[], Any]:
+    nodes = document_nodes(fixture.model.root(fixture.data))
+    get_properties = attrgetter(
+        "status", "variant", *(f"field_{i}" for i in range(fixture.shape.breadth))
+    )
+
+    def run() -> None:
+        for node in nodes:
+            get_properties(node)
+
+    return run
+
+
+@case("property_set")
+def property_set(fixture: Fixture) -> Callable[[], Any]:
+    nodes = document_nodes(fixture.model.root(fixture.data))
+    status = list(fixture.model.status)[0].value
+
+    def run() -> None:
+        for node in nodes:
+            node.status = status
+
+    return run
+
+
+@case("to_builtin")
+def to_builtin(fixture: Fixture) -> Callable[[], Any]:
+    return fixture.model.root(fixture.data).to_builtin
+
+
+@case("to_json")
+def to_json(fixture: Fixture) -> Callable[[], Any]:
+    return fixture.model.root(fixture.data).to_json
+
+
+@case("to_json_cached", requires=("to_json(cache=True)", has_json_cache))
+def to_json_cached(fixture: Fixture) -> Callable[[], Any]:
+    document = fixture.model.root(fixture.data)
+    document.to_json(cache=True)
+    return lambda: document.to_json(cache=True)
+
+
+@case("to_yaml")
+def to_yaml(fixture: Fixture) -> Callable[[], Any]:
+    return fixture.model.root(fixture.data).to_yaml
+
+
+@case("walk_elements")
+def walk_elements(fixture: Fixture) -> Callable[[], Any]:
+    document = fixture.model.root(fixture.data)
+    return lambda: deque(document.walk_elements(), maxlen=0)
+
+
+@case("deepcopy")
+def deepcopy(fixture: Fixture) -> Callable[[], Any]:
+    document = fixture.model.root(fixture.data)
+    return lambda: copy.deepcopy(document)
+
+
+class Result(NamedTuple):
+    """
+    The timings of one benchmark case for one shape, in seconds per call.
+    """
+
+    shape: str
+    case: str
+    best: Optional[float]
+    median: Optional[float]
+    loops: int
+    skipped: Optional[str] = None
+
+
+def measure(function: Callable[[], Any], min_time: float, repeat: int) -> Result:
+    """
+    Time a function, calling it enough times in each sample for the sample to
+    take at least `min_time` seconds. Garbage collection is disabled while timing.
+    """
+    timer = timeit.Timer(function)
+    loops = 1
+    while True:
+        elapsed = timer.timeit(loops)
+        if elapsed >= min_time:
+            break
+        loops = max(loops * 2, int(loops * min_time * 1.2 / max(elapsed, 1e-9)))
+    timings = [elapsed / loops for elapsed in timer.repeat(repeat, loops)]
+    return Result("", "", min(timings), statistics.median(timings), loops)
+
+
+def run_suite(
+    shape_names: List[str], case_names: List[str], min_time: float, repeat: int
+) -> List[Result]:
+    results = []
+    for shape_name in shape_names:
+        shape = SHAPES[shape_name]
+        fixture = Fixture(
+            shape=shape,
+            model=build_model(shape, prefix=f"{shape_name.title().replace('_', '')}"),
+            data=build_document(shape),
+            variants=[build_variant(shape, n) for n in range(shape.fan_out * 4)],
+        )
+        for case_name in case_names:
+            feature, is_available = REQUIREMENTS.get(case_name, (None, None))
+            if is_available is not None and not is_available(fixture):
+                result = Result(
+                    shape_name, case_name, None, None, 0, skipped=f"needs {feature}"
+                )
+            else:
+                function = CASES[case_name](fixture)
+                result = measure(function, min_time, repeat)._replace(
+                    shape=shape_name, case=case_name
+                )
+            print_result(result)
+            results.append(result)
+    return results
+
+
+def print_result(result: Result) -> None:
+    label = f"{result.shape}/{result.case}"
+    if result.skipped:
+        print(f"{label:42}skipped ({result.skipped})")
+    else:
+        print(
+            f"{label:42}{format_time(result.best):>12}{format_time(result.median):>12}"
+        )
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def metadata() -> Dict[str, Any]:
+    source_directory = os.path.dirname(
+        os.path.dirname(os.path.abspath(wysdom.__file__))
+    )
+    try:
+        commit = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=source_directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "wysdom_version": wysdom.__version__,
+        "wysdom_path": source_directory,
+        "commit": commit,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_report(filename: str, results: List[Result]) -> None:
+    with open(filename, "w") as report_file:
+        json.dump(
+            {
+                "metadata": metadata(),
+                "shapes": {name: SHAPES[name]._asdict() for name in SHAPES},
+                "results": [result._asdict() for result in results],
+            },
+            report_file,
+            indent=2,
+        )
+
+
+def compare(filename: str, results: List[Result], threshold: float) -> int:
+    """
+    Print the ratio of each timing to the timing of the same case and shape in a
+    previous report, and return the number of cases that are slower by more
+    than `threshold`.
+    """
+    with open(filename) as report_file:
+        baseline_report = json.load(report_file)
+    baseline = {
+        (result["shape"], result["case"]): result["best"]
+        for result in baseline_report["results"]
+    }
+    baseline_metadata = baseline_report["metadata"]
+    print(
+        f"\nCompared with wysdom {baseline_metadata['wysdom_version']} "
+        f"({baseline_metadata['commit'] or baseline_metadata['wysdom_path']}):"
+    )
+    regressions = 0
+    for result in results:
+        baseline_time = baseline.get((result.shape, result.case))
+        if result.best is None or baseline_time is None:
+            continue
+        ratio = result.best / baseline_time
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  slower"
+            regressions += 1
+        elif ratio < 1 / (1 + threshold):
+            flag = "  faster"
+        print(
+            f"{result.shape + '/' + result.case:42}{format_time(baseline_time):>12}"
+            f"{format_time(result.best):>12}{ratio:>9.3g}x{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES)
+    )
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results with this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fraction by which a case must be slower to count as a regression",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if any case is slower than in the compared report",
+    )
+    args = parser.parse_args()
+
+    print(f"wysdom {wysdom.__version__}, Python {platform.python_version()}")
+    print(f"{'shape/case':42}{'best':>12}{'median':>12}")
+    results = run_suite(args.shapes, args.cases, args.min_time, args.repeat)
+    if args.output:
+        write_report(args.output, results)
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
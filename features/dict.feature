@@ -259,6 +259,38 @@ Feature: Test dictionary DOM objects
       dict_module.Address(example_dict_input)
       """
 
+  Scenario: Property patterns must match at the start of the value
+
+    When we execute the following python code:
+      """
+      class Coded(wysdom.UserObject):
+        code: str = wysdom.UserProperty(str, pattern="abc")
+
+      example = Coded({"code": "abcx"})
+      errors = []
+      for create, value in ((Coded, {"code": "xabc"}), (Coded.from_records, [{"code": "xabc"}])):
+        try:
+          create(value, lazy=True) if create is not Coded else create(value)
+        except ValueError as e:
+          errors.append(e)
+      try:
+        with wysdom.batch(example):
+          example.code = "xabc"
+      except ValueError as e:
+        errors.append(e)
+      """
+    Then the following statements are true:
+      """
+      example.code == "abcx"
+      Coded.from_records([{"code": "abcx"}], lazy=True)[0].code == "abcx"
+      len(errors) == 3
+      example.code == "abcx"
+      """
+    And the following statement raises ValueError
+      """
+      setattr(example, "code", "xabc")
+      """
+
   Scenario: Test invalid value for dictionary key pattern
 
     Given the Python module dict_module.py
@@ -299,3 +331,443 @@ Feature: Test dictionary DOM objects
       """
       Parameter 'pattern' can only be set if 'property_type' is str.
       """
+
+  Scenario: Store DOM elements compactly
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [],
+        "vehicles": {"eabf04": {"color": "orange", "description": "Station Wagon"}}
+      }
+      example = dict_module.Person(example_dict_input)
+      other_example = dict_module.Person(example_dict_input)
+      """
+    Then the following statements are true:
+      """
+      not hasattr(example.vehicles, "__dict__")
+      not hasattr(example.previous_addresses, "__dict__")
+      not hasattr(wysdom.dom.DOMDict({}), "__dict__")
+      example.vehicles.__json_schema_properties__ is other_example.vehicles.__json_schema_properties__
+      example.__json_dom_info__.element is example
+      example.__json_dom_info__.document is example
+      example.vehicles.__json_dom_info__ == (example.vehicles, example, example, "vehicles")
+      """
+
+  Scenario: Deep copies are independent of the original and of each other
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {
+            "color": "orange",
+            "description": "Station Wagon"
+          }
+        }
+      }
+      example = dict_module.Person(example_dict_input)
+      example_copy = copy.deepcopy(example)
+      example_copy.previous_addresses[0].city = "Shelbyville"
+      example_copy.vehicles["eabf04"].color = "pink"
+      addresses_copy = copy.deepcopy(example.previous_addresses)
+      vehicles_copy = copy.deepcopy(example.vehicles)
+      addresses_copy.append(example_dict_input["previous_addresses"][0])
+      del vehicles_copy["eabf04"]
+      """
+    Then the following statements are true:
+      """
+      type(example_copy) is dict_module.Person
+      example.to_builtin() == example_dict_input
+      example.previous_addresses[0].city == "Springfield"
+      example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      example_copy.vehicles["eabf04"].color is dict_module.Color.PINK
+      example_copy.previous_addresses[0].city == "Shelbyville"
+      document(example_copy.previous_addresses[0]) is example_copy
+      parent(example_copy.vehicles["eabf04"]) is example_copy.vehicles
+      key(example_copy.vehicles["eabf04"]) == "eabf04"
+      document(example_copy) is example_copy
+      type(addresses_copy[1]) is dict_module.Address
+      len(addresses_copy) == 2
+      len(example.previous_addresses) == 1
+      parent(addresses_copy) is example
+      len(vehicles_copy) == 0
+      len(example.vehicles) == 1
+      """
+
+  Scenario: Dictionary key patterns are enforced when keys are added
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      from wysdom import instrumentation
+      from wysdom.base_schema import SchemaPattern
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [],
+        "vehicles": {}
+      })
+      instrumentation.reset_statistics()
+      instrumentation.set_enabled(True)
+      try:
+        example.vehicles["abc123"] = {"color": "pink", "description": "Sedan"}
+      finally:
+        instrumentation.set_enabled(False)
+      key_statistics = instrumentation.statistics()["pattern_match"]["^[a-f0-9]{6}$"]
+      example.vehicles["def456"] = {"color": "pink", "description": "Sedan"}
+      with wysdom.trusted():
+        example.vehicles["not a license"] = {"color": "pink", "description": "Sedan"}
+      """
+    Then the following statements are true:
+      """
+      example.vehicles["abc123"].color is dict_module.Color.PINK
+      key(example.vehicles["abc123"]) == "abc123"
+      key_statistics == (1, 1)
+      instrumentation.statistics()["pattern_match"]["^[a-f0-9]{6}$"] == key_statistics
+      "not a license" in example.vehicles
+      SchemaPattern("^[a-f0-9]{6}$")._compiled_pattern is SchemaPattern("^[a-f0-9]{6}$")._compiled_pattern
+      """
+    And the following statement raises ValidationError
+      """
+      example.vehicles.__setitem__("badkey", {"color": "pink", "description": "Sedan"})
+      """
+
+  Scenario: Properties are accessed through accessors built for each class
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }]
+      })
+      example.__json_cache__ = "{}"
+      example.first_name = "Homer"
+      example.previous_addresses[0].postal_code = "58009"
+      example.vehicles["eabf04"] = {"color": "pink", "description": "Sedan"}
+      example.vehicles["eabf04"].color = "orange"
+      """
+    Then the following statements are true:
+      """
+      isinstance(vars(dict_module.Person)["first_name"], property)
+      set(wysdom.properties(dict_module.Person)) == {"first_name", "last_name", "current_address", "previous_addresses", "vehicles"}
+      example.first_name == "Homer"
+      example["first_name"] == "Homer"
+      example.current_address == example.previous_addresses[0]
+      example.previous_addresses[0].postal_code == 58009
+      example.previous_addresses[0].second_line is None
+      example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      example.vehicles is example.vehicles
+      example.__json_cache__ is None
+      example.to_builtin()["previous_addresses"][0]["postal_code"] == 58009
+      """
+    And the following statement raises ValueError
+      """
+      setattr(example, "last_name", None)
+      """
+    And the following statement raises ValidationError
+      """
+      setattr(example.vehicles["eabf04"], "color", "blue")
+      """
+
+  Scenario: Subclasses that override item access use their overrides for inherited properties
+
+    When we execute the following python code:
+      """
+      class Base(wysdom.UserObject):
+        name = wysdom.UserProperty(str)
+
+      class Upper(Base):
+        def __getitem__(self, key):
+          value = super().__getitem__(key)
+          return value.upper() if isinstance(value, str) else value
+
+      base_example = Base({"name": "abc"})
+      upper_example = Upper({"name": "abc"})
+      """
+    Then the following statements are true:
+      """
+      base_example.name == "abc"
+      upper_example.name == "ABC"
+      isinstance(vars(Base)["name"], property)
+      isinstance(vars(Upper)["name"], wysdom.UserProperty)
+      """
+
+  Scenario: Elements are found and resolved by their JSON pointers
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }, {
+          "first_line": "1 Main Street",
+          "city": "Shelbyville",
+          "postal_code": 58009
+        }],
+        "vehicles": {
+          "eabf04": {"color": "orange", "description": "Station Wagon"}
+        }
+      })
+      shelbyville = example.previous_addresses[1]
+      shelbyville_path = wysdom.path_of(shelbyville)
+      city, postal_code = wysdom.get_many(example, ["/previous_addresses/1/city", "/previous_addresses/1/postal_code"])
+      example.previous_addresses.insert(0, {
+        "first_line": "1 Springfield Avenue",
+        "city": "Capital City",
+        "postal_code": 58010
+      })
+      del example.previous_addresses[1]
+      example.vehicles["abc123"] = {"color": "pink", "description": "Sedan"}
+      old_vehicle = example.vehicles["eabf04"]
+      del example.vehicles["eabf04"]
+      """
+    Then the following statements are true:
+      """
+      shelbyville_path == "/previous_addresses/1"
+      city == "Shelbyville"
+      postal_code == 58009
+      wysdom.path_of(example) == ""
+      wysdom.resolve(example, "") is example
+      wysdom.path_of(shelbyville) == "/previous_addresses/1"
+      wysdom.resolve(example, "/previous_addresses/1") is shelbyville
+      wysdom.resolve(example, "/previous_addresses/0/city") == "Capital City"
+      wysdom.resolve(shelbyville, "/city") == "Shelbyville"
+      wysdom.resolve(example.vehicles, "/abc123/color") is dict_module.Color.PINK
+      wysdom.path_of(example.vehicles["abc123"]) == "/vehicles/abc123"
+      """
+    And the following statement raises KeyError
+      """
+      wysdom.resolve(example, "/previous_addresses/2")
+      """
+    And the following statement raises KeyError
+      """
+      wysdom.resolve(example, "/vehicles/eabf04")
+      """
+    And the following statement raises ValueError
+      """
+      wysdom.path_of(old_vehicle)
+      """
+
+  Scenario: Walk through a document with callbacks, pruning and filters
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "current_address": {
+          "first_line": "123 Fake Street",
+          "city": "Springfield",
+          "postal_code": 58008
+        },
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {"color": "orange", "description": "Station Wagon"}
+        }
+      })
+      events = []
+      elements = list(wysdom.walk(
+        example,
+        enter=events.append,
+        leave=events.append,
+        include_values=False
+      ))
+      addresses = [dom_info.element for dom_info in wysdom.walk(example, types=dict_module.Address)]
+      colors = [dom_info.element for dom_info in wysdom.walk(example, types=dict_module.Color)]
+      pruned = [
+        dom_info.element_key
+        for dom_info in wysdom.walk(example, enter=lambda dom_info: dom_info.element_key != "vehicles")
+      ]
+      """
+    Then the following statements are true:
+      """
+      [dom_info.element for dom_info in elements] == [example, example.current_address, example.previous_addresses, example.previous_addresses[0], example.vehicles, example.vehicles["eabf04"]]
+      [dom_info.element_key for dom_info in events] == [None, "current_address", "current_address", "previous_addresses", None, None, "previous_addresses", "vehicles", "eabf04", "eabf04", "vehicles", None]
+      events[0].element is example and events[-1].element is example
+      addresses == [example.current_address, example.previous_addresses[0]]
+      colors == [dict_module.Color.ORANGE]
+      pruned[-1] == "vehicles"
+      "eabf04" not in pruned
+      "first_line" in pruned
+      """
+
+  Scenario: Record instrumentation statistics when instrumentation is enabled
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      from wysdom import instrumentation
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }]
+      }
+      dict_module.Person(example_dict_input)
+      events = []
+      hook = lambda *event, events=events: events.append(event)
+      instrumentation.reset_statistics()
+      instrumentation.add_hook(hook)
+      instrumentation.set_enabled(True)
+      try:
+        example = dict_module.Person(example_dict_input)
+        example.current_address
+        enabled = instrumentation.is_enabled()
+      finally:
+        instrumentation.set_enabled(False)
+        instrumentation.remove_hook(hook)
+      statistics = instrumentation.statistics()
+      dict_module.Person(example_dict_input)
+      """
+    Then the following statements are true:
+      """
+      enabled
+      not instrumentation.is_enabled()
+      statistics["validate"]["dict_module.Person"].count == 1
+      statistics["validate"]["dict_module.Person"].total > 0
+      statistics["construct"]["dict_module.Person"].count == 1
+      statistics["construct"]["dict_module.Address"].count == 2
+      statistics["default"]["dict_module.Person.current_address"].count == 1
+      ("validate", "dict_module.Person", statistics["validate"]["dict_module.Person"].total) in events
+      len(events) == sum(keys[key].count for keys in statistics.values() for key in keys)
+      instrumentation.statistics() == statistics
+      """
+
+  Scenario: Batched changes are validated together and undone if they are not valid
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {"color": "orange", "description": "Station Wagon"}
+        }
+      })
+      with wysdom.batch(example):
+        example.first_name = "Homer"
+        example.vehicles["not a license"] = {"color": "pink", "description": "Sedan"}
+        example.vehicles["abc123"] = example.vehicles["not a license"].to_builtin()
+        del example.vehicles["not a license"]
+      committed = example.to_builtin()
+      try:
+        with wysdom.batch(example):
+          example.last_name = "Bouvier"
+          example.previous_addresses.append({"first_line": "no number", "city": "Shelbyville", "postal_code": 58009})
+      except Exception as e:
+        invalid_change_failed = type(e).__name__ == "ValidationError"
+      try:
+        with wysdom.batch(example.previous_addresses[0]):
+          example.previous_addresses[0].city = "Shelbyville"
+          raise RuntimeError("Moving cancelled")
+      except RuntimeError:
+        exception_failed = True
+      try:
+        with wysdom.batch(example):
+          example.current_address = {"first_line": "1 Road", "city": {"nested": 1}, "postal_code": 3.7}
+      except Exception as e:
+        nested_change_error = type(e).__name__
+      other_failures = []
+      other_example = copy.deepcopy(example)
+      del other_example.previous_addresses[0]
+      with wysdom.batch(example.vehicles):
+        try:
+          other_example.previous_addresses.append({"first_line": "no number", "city": "Shelbyville", "postal_code": 1})
+        except Exception as e:
+          other_failures.append(type(e).__name__)
+        try:
+          dict_module.Address({"first_line": "no number", "city": "Shelbyville", "postal_code": 1})
+        except Exception as e:
+          other_failures.append(type(e).__name__)
+      """
+    Then the following statements are true:
+      """
+      committed["first_name"] == "Homer"
+      set(committed["vehicles"]) == {"eabf04", "abc123"}
+      invalid_change_failed
+      exception_failed
+      example.to_builtin() == committed
+      example.last_name == "Simpson"
+      len(example.previous_addresses) == 1
+      example.previous_addresses[0].city == "Springfield"
+      parent(example.previous_addresses[0]) is example.previous_addresses
+      document(example.previous_addresses[0]) is example
+      wysdom.path_of(example.vehicles["abc123"]) == "/vehicles/abc123"
+      other_failures == ["ValidationError", "ValidationError"]
+      nested_change_error == "ValidationError"
+      example.to_builtin() == committed
+      len(other_example.previous_addresses) == 0
+      """
+
+  Scenario: Objects can be pickled after they have been validated
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      import pickle
+      import sys
+      # Make the example module importable by name, as the pickled classes refer to it
+      sys.modules["dict_module"] = dict_module
+      example = dict_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {"color": "orange", "description": "Station Wagon"}
+        }
+      })
+      schema(dict_module.Person).validator
+      copied = pickle.loads(pickle.dumps(example))
+      """
+    Then the following statements are true:
+      """
+      copied.to_builtin() == example.to_builtin()
+      copied.previous_addresses[0].city == "Springfield"
+      parent(copied.previous_addresses[0]) is copied.previous_addresses
+      copied.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      """
+    And the following statement raises ValidationError
+      """
+      copied.previous_addresses.append({"first_line": "no number", "city": "Shelbyville", "postal_code": 58009})
+      """
@@ -25,6 +25,10 @@ class Address(UserObject):
     postal_code: str = UserProperty(int)
 
 
+class Tally(UserObject):
+    counts: List[int] = ListProperty(int)
+
+
 class Person(UserObject):
     first_name: str = UserProperty(str)
     last_name: str = UserProperty(str)
@@ -120,4 +120,322 @@ Feature: Test JSON DOM objects
     Then the following statement raises ValidationError
       """
       json_module.Person.from_json(example_json_input)
-      """
\ No newline at end of file
+      """
+  Scenario: Create child elements lazily when they are first accessed
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      example = json_module.Person.from_json_file(
+        "./features/examples/data/example.json", lazy=True
+      )
+      raw_address_before_access = example.__json_element_data__["current_address"]
+      raw_vehicles_before_access = example.__json_element_data__["vehicles"]
+      current_address = example.current_address
+      example_json_output = example.to_json()
+      """
+    Then the following statements are true:
+      """
+      not isinstance(raw_address_before_access, wysdom.dom.DOMElement)
+      not isinstance(raw_vehicles_before_access, wysdom.dom.DOMElement)
+      type(current_address) is json_module.Address
+      example.current_address is current_address
+      example.__json_element_data__["current_address"] is current_address
+      not isinstance(example.__json_element_data__["previous_addresses"], wysdom.dom.DOMElement)
+      example.first_name == "Marge"
+      current_address.first_line == "123 Fake Street"
+      example.previous_addresses[0].first_line == "742 Evergreen Terrace"
+      example.previous_addresses[0] is example.previous_addresses[0]
+      parent(current_address) is example
+      document(current_address) is example
+      key(current_address) == "current_address"
+      parent(example.previous_addresses[0]) is example.previous_addresses
+      document(example.previous_addresses[0]) is example
+      document(example.vehicles["eabf04"]) is example
+      key(example.vehicles["eabf04"]) == "eabf04"
+      example.vehicles["eabf04"].license == "eabf04"
+      json.loads(example_json_output) == json.load(open("./features/examples/data/example.json"))
+      """
+
+  Scenario: Validate the whole document up front when creating child elements lazily
+
+    Given the Python module json_module.py
+    And the following string, example_json_input
+      """
+      {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "current_address": {
+          "first_line": "123 Fake Street",
+          "second_line": "",
+          "city": "Springfield",
+          "postal_code": 58008
+        },
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "second_line": "",
+          "postal_code": 58008
+        }],
+        "vehicles": {}
+      }
+      """
+    Then the following statement raises ValidationError
+      """
+      json_module.Person.from_json(example_json_input, lazy=True)
+      """
+    And the following statement raises ValidationError
+      """
+      json_module.Person.from_json(example_json_input)
+      """
+
+  Scenario: List items are converted and rejected in the same way when creating child elements lazily
+
+    When we execute the following python code:
+      """
+      class Tagged(wysdom.UserObject, wysdom.ReadsJSON):
+        tags = wysdom.ListProperty(int)
+
+      results = []
+      for tags in ('["5", 1.5, true]', '["x"]'):
+        for lazy in (False, True):
+          try:
+            results.append(Tagged.from_json('{"tags": %s}' % tags, lazy=lazy).tags.to_builtin())
+          except Exception as e:
+            results.append((type(e), str(e)))
+      """
+    Then the following statements are true:
+      """
+      results[0] == results[1] == [5, 1, 1]
+      results[2] == results[3]
+      results[2][0] is ValueError
+      """
+
+  Scenario: Read the items of a JSON array file one at a time
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      people = []
+      for person in json_module.Person.iter_json_file(
+        "./features/examples/data/example_array.json", chunk_size=16
+      ):
+        people.append(person)
+      lazy_people = []
+      for person in json_module.Person.iter_json_file(
+        "./features/examples/data/example_array.json", lazy=True
+      ):
+        lazy_people.append(person)
+      expected_people = json.load(open("./features/examples/data/example_array.json"))
+      """
+    Then the following statements are true:
+      """
+      len(people) == 2
+      type(people[0]) is json_module.Person
+      people[0].first_name == "Marge"
+      people[1].first_name == "Homer"
+      people[0].current_address.first_line == "123 Fake Street"
+      document(people[1].current_address) is people[1]
+      people[0].to_builtin() == expected_people[0]
+      people[1].to_builtin() == expected_people[1]
+      lazy_people[1].to_builtin() == expected_people[1]
+      """
+
+  Scenario: Read the records of a JSON Lines file one at a time
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      people = []
+      for person in json_module.Person.iter_jsonl_file(
+        "./features/examples/data/example.jsonl"
+      ):
+        people.append(person)
+      """
+    Then the following statements are true:
+      """
+      len(people) == 2
+      type(people[1]) is json_module.Person
+      people[0].first_name == "Marge"
+      people[1].first_name == "Homer"
+      people[0].vehicles["eabf04"].color == "orange"
+      len(people[1].vehicles) == 0
+      """
+
+  Scenario: Write JSON to a stream or a file without copying the document
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      import io
+      import os
+      import tempfile
+      example = json_module.Person.from_json_file("./features/examples/data/example.json")
+      lazy_example = json_module.Person.from_json_file(
+        "./features/examples/data/example.json", lazy=True
+      )
+      json_stream = io.StringIO()
+      example.write_json(json_stream)
+      lazy_json_stream = io.StringIO()
+      lazy_example.write_json(lazy_json_stream)
+      with tempfile.TemporaryDirectory() as temp_dir:
+        output_filename = os.path.join(temp_dir, "example.json")
+        example.to_json_file(output_filename)
+        with open(output_filename) as output_file:
+          json_file_output = output_file.read()
+      """
+    Then the following statements are true:
+      """
+      json_stream.getvalue() == json.dumps(example.to_builtin())
+      lazy_json_stream.getvalue() == json.dumps(example.to_builtin())
+      json_file_output == example.to_json()
+      example.to_json() == json.dumps(example.to_builtin())
+      json.loads(json_file_output) == json.load(open("./features/examples/data/example.json"))
+      """
+
+  Scenario: Only re-encode the elements that have changed since the last serialization
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      import io
+      example = json_module.Person.from_json_file("./features/examples/data/example.json")
+      first_json_output = example.to_json(cache=True)
+      cached_address_json = example.current_address.__json_cache__
+      example.previous_addresses[0].city = "Shelbyville"
+      address_cache_after_change = example.previous_addresses[0].__json_cache__
+      list_cache_after_change = example.previous_addresses.__json_cache__
+      document_cache_after_change = example.__json_cache__
+      second_json_output = example.to_json(cache=True)
+      example.previous_addresses.insert(0, example.current_address.to_builtin())
+      third_json_output = example.to_json(cache=True)
+      del example.vehicles["eabf04"]
+      fourth_json_output = example.to_json(cache=True)
+      json_stream = io.StringIO()
+      example.write_json(json_stream)
+      """
+    Then the following statements are true:
+      """
+      json.loads(first_json_output) == json.load(open("./features/examples/data/example.json"))
+      example.current_address.__json_cache__ is cached_address_json
+      address_cache_after_change is None
+      list_cache_after_change is None
+      document_cache_after_change is None
+      json.loads(second_json_output)["previous_addresses"][0]["city"] == "Shelbyville"
+      len(json.loads(third_json_output)["previous_addresses"]) == 2
+      json.loads(fourth_json_output)["vehicles"] == {}
+      fourth_json_output == example.to_json()
+      json_stream.getvalue() == example.to_json()
+      """
+
+  Scenario: Elements containing raw dicts and lists are re-encoded every time
+
+    When we execute the following python code:
+      """
+      import io
+      class Tagged(wysdom.UserObject, wysdom.ReadsJSON):
+        name = wysdom.UserProperty(str)
+        meta = wysdom.UserProperty(wysdom.SchemaAnything())
+        extra = wysdom.DictProperty(wysdom.SchemaAnything())
+
+      tagged = Tagged(
+        {"name": "example", "meta": {"x": 1}, "extra": {"labels": ["a"], "size": {"w": 2}}}
+      )
+      first_json_output = tagged.to_json(cache=True)
+      tagged.meta["x"] = 2
+      tagged.extra["labels"].append("b")
+      second_json_output = tagged.to_json(cache=True)
+      json_stream = io.StringIO()
+      tagged.write_json(json_stream)
+      cached_json_stream = io.StringIO()
+      tagged.write_json(cached_json_stream, cache=True)
+      """
+    Then the following statements are true:
+      """
+      json.loads(first_json_output)["meta"] == {"x": 1}
+      json.loads(second_json_output) == {"name": "example", "meta": {"x": 2}, "extra": {"labels": ["a", "b"], "size": {"w": 2}}}
+      tagged.__json_cache__ is None
+      tagged.extra.__json_cache__ is None
+      json_stream.getvalue() == tagged.to_json()
+      cached_json_stream.getvalue() == tagged.to_json()
+      """
+
+  Scenario: Shallow copies are re-encoded when the children they share are changed
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      example = json_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "current_address": {
+          "first_line": "123 Fake Street",
+          "second_line": "",
+          "city": "Springfield",
+          "postal_code": 58008
+        },
+        "previous_addresses": [],
+        "vehicles": {}
+      })
+      shallow_copy = copy.copy(example)
+      first_json_output = shallow_copy.to_json(cache=True)
+      shallow_copy.current_address.city = "Shelbyville"
+      second_json_output = shallow_copy.to_json(cache=True)
+      """
+    Then the following statements are true:
+      """
+      shallow_copy.current_address is example.current_address
+      json.loads(first_json_output)["current_address"]["city"] == "Springfield"
+      json.loads(second_json_output)["current_address"]["city"] == "Shelbyville"
+      second_json_output == shallow_copy.to_json()
+      """
+
+  Scenario: Deep copies of lazy objects share the data that has not been accessed
+
+    Given the Python module json_module.py
+    When we execute the following python code:
+      """
+      example = json_module.Person.from_json_file(
+        "./features/examples/data/example.json", lazy=True
+      )
+      example.current_address.city = "Shelbyville"
+      example_copy = copy.deepcopy(example)
+      copy_of_copy = copy.deepcopy(example_copy)
+      original_json = example.to_json()
+      example_copy.previous_addresses[0].city = "Capital City"
+      example_copy.current_address.city = "Ogdenville"
+      """
+    Then the following statements are true:
+      """
+      copy_of_copy.__json_element_data__["vehicles"] is example.__json_element_data__["vehicles"]
+      example_copy.__json_element_data__["vehicles"] is example.__json_element_data__["vehicles"]
+      copy_of_copy.current_address.city == "Shelbyville"
+      parent(example_copy.current_address) is example_copy
+      document(example_copy.previous_addresses[0]) is example_copy
+      example.to_json() == original_json
+      copy_of_copy.to_json() == original_json
+      example.previous_addresses[0].city == "Springfield"
+      json.loads(example_copy.to_json())["previous_addresses"][0]["city"] == "Capital City"
+      json.loads(example_copy.to_json())["current_address"]["city"] == "Ogdenville"
+      """
+
+  Scenario: Serialize values nested too deeply for the standard JSON encoder
+
+    When we execute the following python code:
+      """
+      class Nested(wysdom.UserObject, wysdom.ReadsJSON):
+        meta = wysdom.UserProperty(wysdom.SchemaAnything())
+
+      deep_value = []
+      innermost = deep_value
+      for depth in range(5000):
+        innermost.append([])
+        innermost = innermost[0]
+      nested = Nested({"meta": deep_value})
+      json_output = nested.to_json()
+      cached_json_output = nested.to_json(cache=True)
+      """
+    Then the following statements are true:
+      """
+      json_output == '{"meta": ' + "[" * 5001 + "]" * 5001 + "}"
+      cached_json_output == json_output
+      """
@@ -234,4 +234,35 @@ Feature: Generic mixin for registering subclasses by name
       """
       The key 'dog' is ambiguous as it matches multiple proper subclasses of <class 'Animal'>:
       [<class 'Dog'>, <class 'PetDog'>]
-      """
\ No newline at end of file
+      """
+  Scenario: Include subclasses registered after the registered subclasses were looked up
+
+    When we execute the following python code:
+      """
+      from wysdom.mixins import RegistersSubclasses
+      from wysdom.mixins import has_registered_subclasses
+
+      class Animal(RegistersSubclasses):
+        pass
+
+      animal_had_subclasses = has_registered_subclasses(Animal)
+
+      class Dog(Animal, register_as="dog"):
+        pass
+
+      subclasses_before_cat = Animal.registered_subclasses()
+
+      class Cat(Animal, register_as="cat"):
+        pass
+      """
+    Then the following statements are true:
+      """
+      not animal_had_subclasses
+      has_registered_subclasses(Animal)
+      not has_registered_subclasses(Cat)
+      subclasses_before_cat == {"dog": [Dog]}
+      Animal.registered_subclasses() == {"dog": [Dog], "cat": [Cat]}
+      Animal.registered_subclasses() is not Animal.registered_subclasses()
+      Animal.registered_subclasses_by_name("cat") == [Cat]
+      Animal.registered_subclass("cat") is Cat
+      """
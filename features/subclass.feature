@@ -87,3 +87,108 @@ Feature: Test subclassed DOM objects
       | subclass_module      |
       | late_subclass_module |
 
+
+  Scenario Outline: Dispatch registered subclasses using a constant property
+
+    Given the Python module <module>.py
+    When we execute the following python code:
+      """
+      validated_cats = []
+      cat_schema = schema(<module>.Cat)
+      cat_schema.is_valid = validated_cats.append
+      example = <module>.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "pets": [{"pet_type": "greyhound", "name": "Santa's Little Helper"}]
+      })
+      del cat_schema.is_valid
+      validated_greyhounds = []
+      greyhound_schema = schema(<module>.Greyhound)
+      greyhound_schema.is_valid = validated_greyhounds.append
+      trusted_example = <module>.Person.from_trusted(example.to_builtin())
+      del greyhound_schema.is_valid
+      ambiguous_schema = wysdom.SchemaAnyOf(
+        [wysdom.SchemaPrimitive(str), wysdom.SchemaConst("cat")]
+      )
+      """
+    Then the following statements are true:
+      """
+      schema(<module>.Pet).inner_schema.discriminator == "pet_type"
+      validated_cats == []
+      type(example.pets[0]) is <module>.Greyhound
+      validated_greyhounds == []
+      type(trusted_example.pets[0]) is <module>.Greyhound
+      schema(<module>.Pet).is_valid({"pet_type": "cat", "name": "Snowball II"})
+      not schema(<module>.Pet).is_valid({"pet_type": "dog", "name": "Spot"})
+      not schema(<module>.Pet).is_valid({"pet_type": "cat"})
+      ambiguous_schema.discriminator is None
+      """
+    And the following statement raises ValidationError
+      """
+      schema(<module>.Pet)({"pet_type": "dog", "name": "Spot"})
+      """
+    And the following statement raises ValidationError
+      """
+      ambiguous_schema("cat")
+      """
+
+    Examples:
+      | module               |
+      | subclass_module      |
+      | late_subclass_module |
+
+  Scenario: Lazy and eager creation raise the same error for an item with no matching subclass
+
+    Given the Python module subclass_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "pets": [{"pet_type": "dog", "name": "Spot"}]
+      }
+      from wysdom.dom.DOMElement import _BuildInfo
+      raised = []
+      for lazy in (False, True):
+        try:
+          subclass_module.Person(example_dict_input, _BuildInfo(lazy=lazy))
+        except Exception as e:
+          raised.append((type(e), str(e)))
+      """
+    Then the following statements are true:
+      """
+      len(raised) == 2
+      raised[0] == raised[1]
+      raised[0][0] is wysdom.ValidationError
+      raised[0][1].startswith("No valid schema was found")
+      """
+
+  Scenario: Find all instances of a class in a document
+
+    Given the Python module subclass_module.py
+    When we execute the following python code:
+      """
+      example = subclass_module.Person({
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "pets": [
+          {"pet_type": "greyhound", "name": "Santa's Little Helper"},
+          {"pet_type": "cat", "name": "Snowball II"}
+        ]
+      })
+      greyhound, cat = example.pets
+      pets_before = wysdom.instances_of(example, subclass_module.Pet)
+      example.pets.append({"pet_type": "cat", "name": "Snowball V"})
+      new_cat = example.pets[2]
+      del example.pets[0]
+      """
+    Then the following statements are true:
+      """
+      len(pets_before) == 2
+      {id(pet) for pet in pets_before} == {id(greyhound), id(cat)}
+      {id(pet) for pet in wysdom.instances_of(example, subclass_module.Pet)} == {id(cat), id(new_cat)}
+      {id(pet) for pet in wysdom.instances_of(example, "subclass_module.Cat")} == {id(cat), id(new_cat)}
+      wysdom.instances_of(example, subclass_module.Dog) == []
+      wysdom.instances_of(example, subclass_module.Person) == [example]
+      wysdom.instances_of(example.pets[1], subclass_module.Pet) == [new_cat]
+      """
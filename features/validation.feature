@@ -0,0 +1,437 @@
+Feature: Test schema validation
+
+  Scenario: Reuse the compiled validator until a new subclass is registered
+
+    Given the Python module subclass_module.py
+    When we execute the following python code:
+      """
+      pet_schema = schema(subclass_module.Pet)
+      first_validator = pet_schema.validator
+      cat_input = {"pet_type": "cat", "name": "Snowball II"}
+      tortoise_input = {"pet_type": "tortoise", "name": "Mojo"}
+      tortoise_was_valid = pet_schema.is_valid(tortoise_input)
+
+      class Tortoise(subclass_module.Pet):
+        pet_type: str = wysdom.UserProperty(wysdom.SchemaConst("tortoise"))
+
+        def speak(self):
+          return "..."
+      """
+    Then the following statements are true:
+      """
+      schema(subclass_module.Pet) is pet_schema
+      pet_schema.inner_schema is pet_schema.inner_schema
+      len(pet_schema.inner_schema.allowed_schemas) == 3
+      pet_schema.is_valid(cat_input)
+      not tortoise_was_valid
+      pet_schema.validator is not first_validator
+      pet_schema.validator is pet_schema.validator
+      pet_schema.is_valid(tortoise_input)
+      """
+
+  Scenario: Validate nested objects only once, at the root of the document
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "current_address": {
+          "first_line": "123 Fake Street",
+          "city": "Springfield",
+          "postal_code": 58008
+        },
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }]
+      }
+      validated_values = []
+      address_schema = schema(dict_module.Address)
+      address_schema.validate = validated_values.append
+      example = dict_module.Person(example_dict_input)
+      del address_schema.validate
+      """
+    Then the following statements are true:
+      """
+      validated_values == [example_dict_input["previous_addresses"][0]]
+      example.current_address.city == "Springfield"
+      wysdom.dom.DOMInfo._fields == ("element", "document", "parent", "element_key")
+      all(len(info) == 4 for info in example.walk_elements())
+      [element for element, document, parent, key in example.walk_elements()][0] is example
+      """
+
+  Scenario: Native validation gives the same results as jsonschema
+
+    Given the Python module dict_module.py
+    And the Python module subclass_module.py
+    When we execute the following python code:
+      """
+      from enum import Enum
+
+      class Level(Enum):
+        LOW = 0
+        HIGH = 1
+        MAXIMUM = 2.5
+
+      schemas_to_test = [
+        wysdom.SchemaAnything(),
+        wysdom.SchemaNone(),
+        wysdom.SchemaPrimitive(str),
+        wysdom.SchemaPrimitive(int),
+        wysdom.SchemaPrimitive(float),
+        wysdom.SchemaPrimitive(bool),
+        wysdom.SchemaConst("cat"),
+        wysdom.base_schema.SchemaConst(True),
+        wysdom.base_schema.SchemaConst(1),
+        wysdom.base_schema.SchemaEnum(dict_module.Color),
+        wysdom.base_schema.SchemaEnum(Level),
+        wysdom.base_schema.SchemaPattern(r"\d+"),
+        wysdom.SchemaArray(int),
+        wysdom.SchemaDict(int),
+        wysdom.SchemaDict(str, key_pattern=r"^[a-f0-9]{6}$"),
+        wysdom.SchemaObject(
+          properties={"a": wysdom.SchemaPrimitive(int)},
+          required={"a"},
+        ),
+        wysdom.SchemaObject(
+          properties={"a": wysdom.SchemaPrimitive(int)},
+          additional_properties=True,
+        ),
+        wysdom.SchemaObject(
+          properties={"a": wysdom.SchemaPrimitive(int)},
+          additional_properties=wysdom.SchemaPrimitive(str),
+        ),
+        wysdom.SchemaAnyOf([wysdom.SchemaPrimitive(str), wysdom.SchemaNone()]),
+        schema(dict_module.Address),
+        schema(dict_module.Vehicle),
+        schema(dict_module.Person),
+        schema(subclass_module.Pet),
+        schema(subclass_module.Person),
+      ]
+      values_to_test = [
+        None, True, False, 0, 1, 2, 0.0, 1.0, 1.5, 2.5, "", "cat", "123", "x123",
+        "pink", "orange", [], [1, "a"], {}, {"a": 1}, {"a": "1"}, {"a": 1, "b": 2},
+        {"a": 1, "b": "2"}, {"abc123": "x"}, {"ABC123": "x"}, {"abc123": 5},
+        {"color": "pink", "description": "Car"},
+        {"color": "green", "description": "Car"},
+        {"first_line": "1 Road", "city": "Town", "postal_code": 12345},
+        {"first_line": "Road", "city": "Town", "postal_code": 12345},
+        {"first_line": "1 Road", "city": "Town", "postal_code": "12345"},
+        {"first_line": "1 Road", "city": "Town"},
+        {"pet_type": "cat", "name": "Snowball II"},
+        {"pet_type": "greyhound", "name": "Santa's Little Helper"},
+        {"pet_type": "dog", "name": "Spot"},
+        {"pet_type": "cat", "name": "Snowball II", "age": 3},
+        {"first_name": "Marge", "last_name": "Simpson", "pets": []},
+        {"first_name": "Marge", "last_name": "Simpson", "previous_addresses": []},
+        {
+          "first_name": "Marge",
+          "last_name": "Simpson",
+          "previous_addresses": [],
+          "vehicles": {"eabf04": {"color": "orange", "description": "Car"}},
+        },
+        {
+          "first_name": "Marge",
+          "last_name": "Simpson",
+          "previous_addresses": [],
+          "vehicles": {"badkey": {"color": "orange", "description": "Car"}},
+        },
+      ]
+      mismatches = []
+      valid_count = 0
+      for schema_to_test in schemas_to_test:
+        for value in values_to_test:
+          native_result = schema_to_test.is_valid(value)
+          if native_result != schema_to_test.validator.is_valid(value):
+            mismatches.append((schema_to_test, value))
+          valid_count += native_result
+      """
+    Then the following statements are true:
+      """
+      mismatches == []
+      valid_count > len(values_to_test)
+      """
+    And the following statement raises ValidationError
+      """
+      schema(dict_module.Address).validate({"first_line": "Road", "city": "Town", "postal_code": 1})
+      """
+
+  Scenario: Create many objects from a list of records
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      records = [
+        {"first_line": "1 Road", "city": "Town", "postal_code": 12345},
+        {"first_line": "Road", "city": "Town", "postal_code": 12345},
+        {"first_line": "3 Road", "city": "Town", "postal_code": 12345},
+        {"first_line": "4 Road", "city": "Town"},
+      ]
+      errors = []
+      addresses = dict_module.Address.from_records(records, errors=errors)
+      people = [
+        {"first_name": "Marge", "last_name": "Simpson", "previous_addresses": [records[0]]},
+        {"first_name": "Homer", "last_name": "Simpson", "previous_addresses": [{"first_line": "no", "city": "Town", "postal_code": 1}]},
+      ]
+      people_errors = []
+      valid_people = dict_module.Person.from_records(people, errors=people_errors)
+      lazy_addresses = dict_module.Address.from_records(records[:1], lazy=True)
+      streamed_addresses = dict_module.Address.iter_records(iter(records))
+      first_streamed_address = next(streamed_addresses)
+      """
+    Then the following statements are true:
+      """
+      len(addresses) == 2
+      type(addresses[0]) is dict_module.Address
+      addresses[0].first_line == "1 Road"
+      addresses[1].first_line == "3 Road"
+      addresses[1].to_builtin() == records[2]
+      lazy_addresses[0].to_builtin() == records[0]
+      first_streamed_address.first_line == "1 Road"
+      len(errors) == 2
+      errors[0][0] == 1
+      errors[1][0] == 3
+      type(errors[0][1]).__name__ == "ValidationError"
+      len(valid_people) == 1
+      valid_people[0].first_name == "Marge"
+      [index for index, error in people_errors] == [1]
+      """
+    And the following statement raises ValidationError
+      """
+      dict_module.Address.from_records(records)
+      """
+    And the following statement raises ValidationError
+      """
+      dict_module.Address.from_records([records[0], "not a record"])
+      """
+
+  Scenario: Validate records in parallel worker processes
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      import sys
+      # Worker processes find the record class by its module name
+      sys.modules["dict_module"] = dict_module
+      records = []
+      for i in range(25):
+        records.append({"first_line": f"{i} Road", "city": "Town", "postal_code": i})
+      records[7] = {"first_line": "Road", "city": "Town", "postal_code": 7}
+      records[20] = {"first_line": "20 Road", "city": "Town"}
+      errors = []
+      addresses = dict_module.Address.from_records(
+        records, errors=errors, processes=2, chunk_size=4
+      )
+      people = [
+        {"first_name": "Marge", "last_name": "Simpson", "previous_addresses": [records[0]]},
+        {"first_name": "Homer", "last_name": "Simpson", "previous_addresses": [records[7]]},
+        {"first_name": "Bart", "last_name": "Simpson", "previous_addresses": []},
+      ]
+      people_errors = []
+      valid_people = dict_module.Person.from_records(
+        people, errors=people_errors, processes=2, chunk_size=2
+      )
+      tallies = [{"counts": ["1"]}, {"counts": ["x"]}, {"counts": [2]}]
+      tally_results = []
+      for processes in (None, 2):
+        tally_errors = []
+        valid_tallies = dict_module.Tally.from_records(
+          tallies, errors=tally_errors, processes=processes
+        )
+        tally_results.append(
+          ([tally.counts.to_builtin() for tally in valid_tallies], tally_errors)
+        )
+      """
+    Then the following statements are true:
+      """
+      len(addresses) == 23
+      type(addresses[0]) is dict_module.Address
+      addresses[7].postal_code == 8
+      addresses[22].to_builtin() == records[24]
+      len(errors) == 2
+      errors[0][0] == 7
+      errors[1][0] == 20
+      type(errors[1][1]).__name__ == "ValidationError"
+      [person.first_name for person in valid_people] == ["Marge", "Bart"]
+      valid_people[0].previous_addresses[0].city == "Town"
+      [index for index, error in people_errors] == [1]
+      tally_results[0][0] == tally_results[1][0] == [[1], [2]]
+      [index for index, error in tally_results[0][1]] == [1]
+      [index for index, error in tally_results[1][1]] == [1]
+      type(tally_results[1][1][0][1]) is ValueError
+      """
+    And the following statement raises ValidationError
+      """
+      dict_module.Address.from_records(iter(records), processes=2, chunk_size=4)
+      """
+
+  Scenario: Create objects from trusted data without validating it
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {
+            "color": "orange",
+            "description": "Station Wagon"
+          }
+        }
+      }
+      example = dict_module.Person.from_trusted(example_dict_input)
+      lazy_example = dict_module.Person.from_trusted(example_dict_input, lazy=True)
+      unchecked_address = dict_module.Address.from_trusted(
+        {"first_line": "Road", "city": "Town", "postal_code": "12345"}
+      )
+      with wysdom.trusted():
+        example.previous_addresses[0].first_line = "Evergreen Terrace"
+      wysdom.set_always_validate(True)
+      try:
+        dict_module.Address.from_trusted({"first_line": "Road", "city": "Town", "postal_code": 1})
+        always_validate_raised = False
+      except Exception:
+        always_validate_raised = True
+      finally:
+        wysdom.set_always_validate(False)
+      """
+    Then the following statements are true:
+      """
+      type(example) is dict_module.Person
+      example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      lazy_example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      parent(example.vehicles["eabf04"]) is example.vehicles
+      document(example.vehicles["eabf04"]) is example
+      key(example.vehicles["eabf04"]) == "eabf04"
+      document(lazy_example.previous_addresses[0]) is lazy_example
+      unchecked_address.first_line == "Road"
+      unchecked_address.postal_code == 12345
+      example.previous_addresses[0].first_line == "Evergreen Terrace"
+      always_validate_raised
+      """
+    And the following statement raises ValidationError
+      """
+      dict_module.Address({"first_line": "Road", "city": "Town", "postal_code": "12345"})
+      """
+
+  Scenario: Lazy objects do not change when the data they were created from is changed
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      example_dict_input = {
+        "first_name": "Marge",
+        "last_name": "Simpson",
+        "previous_addresses": [{
+          "first_line": "742 Evergreen Terrace",
+          "city": "Springfield",
+          "postal_code": 58008
+        }],
+        "vehicles": {
+          "eabf04": {
+            "color": "orange",
+            "description": "Station Wagon"
+          }
+        }
+      }
+      trusted_example = dict_module.Person.from_trusted(example_dict_input, lazy=True)
+      record_example = dict_module.Person.from_records([example_dict_input], lazy=True)[0]
+      tally = dict_module.Tally.from_trusted({"counts": [1, 2]}, lazy=True)
+      original_builtin = trusted_example.to_builtin()
+      example_dict_input["previous_addresses"][0]["city"] = "Shelbyville"
+      example_dict_input["previous_addresses"].append(example_dict_input["previous_addresses"][0])
+      example_dict_input["vehicles"]["eabf04"]["color"] = "pink"
+      """
+    Then the following statements are true:
+      """
+      trusted_example.to_builtin() == original_builtin
+      record_example.to_builtin() == original_builtin
+      len(trusted_example.previous_addresses) == 1
+      trusted_example.previous_addresses[0].city == "Springfield"
+      record_example.previous_addresses[0].city == "Springfield"
+      trusted_example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      record_example.vehicles["eabf04"].color is dict_module.Color.ORANGE
+      list(tally.counts) == [1, 2]
+      """
+
+  Scenario: Enum values are converted to members with a single lookup
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      from enum import Enum
+      from wysdom.base_schema import SchemaEnum
+      from wysdom.dom.DOMElement import _BuildInfo
+
+      class Status(Enum):
+        ACTIVE = "active"
+        INACTIVE = "inactive"
+        ENABLED = "active"
+        ONE = 1
+        TRUE = True
+
+      status_schema = SchemaEnum(Status)
+      """
+    Then the following statements are true:
+      """
+      status_schema("active") is Status.ACTIVE
+      status_schema("inactive", _BuildInfo(validated=True)) is Status.INACTIVE
+      status_schema(1) is Status.ONE
+      status_schema.allowed_values == ["active", "inactive", 1]
+      status_schema.allowed_values is status_schema.allowed_values
+      status_schema.jsonschema_definition == {"enum": ["active", "inactive", 1]}
+      status_schema.is_valid(1)
+      not status_schema.is_valid(True)
+      status_schema.is_valid(1) == status_schema.validator.is_valid(1)
+      status_schema.is_valid(True) == status_schema.validator.is_valid(True)
+      """
+    And the following statement raises ValidationError
+      """
+      status_schema("enabled")
+      """
+
+  Scenario: Generated schemas are cached until a new subclass is registered
+
+    Given the Python module dict_module.py
+    When we execute the following python code:
+      """
+      class Animal(wysdom.UserObject, wysdom.RegistersSubclasses):
+        name: str = wysdom.UserProperty(str)
+
+      class Horse(Animal):
+        animal_type: str = wysdom.UserProperty(wysdom.SchemaConst("horse"))
+
+      animal_schema = schema(Animal)
+      first_full_schema = animal_schema.jsonschema_full_schema
+      first_validator = animal_schema.validator
+
+      class Donkey(Animal):
+        animal_type: str = wysdom.UserProperty(wysdom.SchemaConst("donkey"))
+
+      second_full_schema = animal_schema.jsonschema_full_schema
+      bundle = wysdom.schema_definitions([dict_module.Person, Animal])
+      animal_name = f"{Animal.__module__}.Animal"
+      """
+    Then the following statements are true:
+      """
+      animal_schema.jsonschema_full_schema is second_full_schema
+      first_full_schema is not second_full_schema
+      animal_schema.validator is not first_validator
+      len(first_full_schema["definitions"][animal_name]["anyOf"]) == 1
+      len(second_full_schema["definitions"][animal_name]["anyOf"]) == 2
+      animal_schema.is_valid({"name": "Eeyore", "animal_type": "donkey"})
+      bundle["$schema"] == "http://json-schema.org/draft-07/schema#"
+      animal_name in bundle["definitions"]
+      len(bundle["definitions"]) == 6
+      bundle["definitions"][animal_name] == second_full_schema["definitions"][animal_name]
+      bundle["definitions"]["dict_module.Person"] == schema(dict_module.Person).jsonschema_definition
+      """
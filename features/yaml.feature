@@ -114,4 +114,81 @@ Feature: Test YAML DOM objects
     Then the following statement raises ValidationError
       """
       yaml_module.Person.from_yaml(example_yaml_input)
-      """
\ No newline at end of file
+      """
+  Scenario: Read each document of a multi-document YAML stream
+
+    Given the Python module yaml_module.py
+    And the following string, example_yaml_input
+      """
+      ---
+      first_name: Marge
+      last_name: Simpson
+      current_address:
+        first_line: 742 Evergreen Terrace
+        second_line: ''
+        city: Springfield
+        postal_code: 58008
+      previous_addresses: []
+      vehicles: {}
+      ---
+      ---
+      first_name: Homer
+      last_name: Simpson
+      current_address:
+        first_line: 742 Evergreen Terrace
+        second_line: ''
+        city: Springfield
+        postal_code: 58008
+      previous_addresses: []
+      vehicles: {}
+      """
+    When we execute the following python code:
+      """
+      from importlib import import_module
+      reads_yaml_module = import_module("wysdom.mixins.ReadsYAML")
+      people = []
+      for person in yaml_module.Person.iter_yaml(example_yaml_input):
+        people.append(person)
+      people_from_file = []
+      for person in yaml_module.Person.iter_yaml_file(
+        "./features/examples/data/example_multi.yaml"
+      ):
+        people_from_file.append(person)
+      """
+    Then the following statements are true:
+      """
+      len(people) == 2
+      type(people[0]) is yaml_module.Person
+      people[0].first_name == "Marge"
+      people[1].first_name == "Homer"
+      len(people_from_file) == 2
+      people_from_file[0].vehicles["eabf04"].color == "orange"
+      people_from_file[1].first_name == "Homer"
+      yaml.safe_load(people_from_file[0].to_yaml()) == people_from_file[0].to_builtin()
+      reads_yaml_module.SafeLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+      reads_yaml_module.SafeDumper is getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+      """
+
+  Scenario: Write YAML to a stream or a file without copying the document
+
+    Given the Python module yaml_module.py
+    When we execute the following python code:
+      """
+      import io
+      import os
+      import tempfile
+      example = yaml_module.Person.from_yaml_file("./features/examples/data/example.yaml")
+      yaml_stream = io.StringIO()
+      example.write_yaml(yaml_stream, default_flow_style=True)
+      with tempfile.TemporaryDirectory() as temp_dir:
+        output_filename = os.path.join(temp_dir, "example.yaml")
+        example.to_yaml_file(output_filename)
+        with open(output_filename) as output_file:
+          yaml_file_output = output_file.read()
+      """
+    Then the following statements are true:
+      """
+      example.to_yaml() == yaml.safe_dump(example.to_builtin())
+      yaml_file_output == yaml.safe_dump(example.to_builtin())
+      yaml_stream.getvalue() == yaml.safe_dump(example.to_builtin(), default_flow_style=True)
+      """
@@ -1,6 +1,19 @@
 from .__version__ import __version__
 from .exceptions import ValidationError
-from .dom import document, parent, key, schema
+from .trust import trusted, set_always_validate
+from .transactions import batch
+from . import instrumentation
+from .dom import (
+    document,
+    parent,
+    key,
+    schema,
+    path_of,
+    resolve,
+    get_many,
+    instances_of,
+    walk,
+)
 from . import dom
 from .base_schema import (
     Schema,
@@ -17,5 +30,6 @@ from .user_objects import (
     ListProperty,
     DictProperty,
     properties,
+    schema_definitions,
 )
 from .mixins import ReadsJSON, ReadsYAML, RegistersSubclasses
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple, Optional
+from typing import Any, Callable, Dict, Tuple, Optional, TypeVar
 
-import jsonschema
+from time import perf_counter
+
+from jsonschema.exceptions import best_match
 from jsonschema.validators import validator_for
 
+from .. import instrumentation
 from ..exceptions import ValidationError
 from ..repr import inspect_based_repr
+from ..trust import is_trusted
+
+T = TypeVar("T")
 
 
 class Schema(ABC):
@@ -18,21 +24,48 @@ class Schema(ABC):
 
     Objects of type `Schema` are also callable, and when called will create DOM objects or
     primitive Python object containing the data that is supplied to them.
+
+    Subclasses may override `is_valid` with a native implementation that gives the same
+    results as jsonschema for their `jsonschema_definition`. A subclass that redefines
+    `jsonschema_definition` without also redefining `is_valid` is always validated
+    with jsonschema.
     """
 
+    __cache_version__: int = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "jsonschema_definition" in cls.__dict__ and "is_valid" not in cls.__dict__:
+            cls.is_valid = Schema.is_valid
+
     def __repr__(self):
         return inspect_based_repr(self)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Cached values, such as compiled validators, are not picklable and are
+        # rebuilt when they are next needed
+        return {
+            name: value
+            for name, value in self.__dict__.items()
+            if not name.startswith("_cached_")
+        }
+
     def __call__(self, value: Any, dom_info: Tuple = None) -> Any:
         """
         Return either a DOM object or primitive Python object containing the data
         supplied in `value`, if `value` is a valid instance of this schema.
 
         :param value:    The raw value for which to create an object
-        :param dom_info: An optional tuple containing DOM information for the object, if relevant
+        :param dom_info: An optional tuple containing DOM information for the object, if relevant.
+                         If its `validated` field is True, or if called in trusted mode (see
+                         :func:`wysdom.trusted`), `value` is not validated.
         :return:         A DOM object or primitive Python object containing the data in `value`
         """
-        if self.is_valid(value):
+        if (
+            getattr(dom_info, "validated", False)
+            or is_trusted()
+            or self.is_valid(value)
+        ):
             return value
         else:
             raise ValidationError(
@@ -61,6 +94,17 @@ class Schema(ABC):
         """
         return {}
 
+    @property
+    def const_properties(self) -> Dict[str, Any]:
+        """
+        A dict of the properties which this schema binds to a constant value, for
+        schemas which describe objects. These can be used to distinguish between
+        alternative schemas without fully validating against each of them.
+
+        :return: A dict of constant values indexed by property name.
+        """
+        return {}
+
     @property
     @abstractmethod
     def jsonschema_definition(self) -> Dict[str, Any]:
@@ -89,9 +133,14 @@ class Schema(ABC):
     def jsonschema_full_schema(self) -> Dict[str, Any]:
         """
         The jsonschema definition to use when using this schema as a standalone schema.
+        The definition is generated only once, and is reused until `invalidate_caches`
+        is called, so it must not be modified.
 
         :return: A jsonschema-compatible dictionary.
         """
+        return self._cached("_cached_full_schema", self._build_full_schema)
+
+    def _build_full_schema(self) -> Dict[str, Any]:
         output_schema = {
             "$schema": "http://json-schema.org/draft-07/schema#",
             "definitions": {
@@ -101,13 +150,99 @@ class Schema(ABC):
         output_schema.update(self.jsonschema_ref_schema)
         return output_schema
 
+    @property
+    def validator(self) -> Any:
+        """
+        A compiled jsonschema validator for `jsonschema_full_schema`. The validator
+        is built (and the schema checked against its meta-schema) only once, and is
+        reused until `invalidate_caches` is called.
+
+        :return: A jsonschema validator instance.
+        """
+        return self._cached("_cached_validator", self._build_validator)
+
+    def _build_validator(self) -> Any:
+        full_schema = self.jsonschema_full_schema
+        validator_class = validator_for(full_schema)
+        validator_class.check_schema(full_schema)
+        return validator_class(full_schema)
+
+    def _cached(self, cache_name: str, build: Callable[[], T]) -> T:
+        """
+        Return a value stored in the attribute `cache_name` of this schema, or build
+        and store it if it is not stored or `invalidate_caches` has been called since.
+
+        :param cache_name: The name of the attribute in which to store the value
+        :param build:      A function returning the value to cache
+        :return:           The cached value
+        """
+        cached = getattr(self, cache_name, None)
+        if cached is None or cached[0] != Schema.__cache_version__:
+            if instrumentation._enabled:
+                instrumentation.record(
+                    "cache_miss", cache_name.replace("_cached", "schema")
+                )
+            cached = (Schema.__cache_version__, build())
+            setattr(self, cache_name, cached)
+        elif instrumentation._enabled:
+            instrumentation.record("cache_hit", cache_name.replace("_cached", "schema"))
+        return cached[1]
+
+    @staticmethod
+    def invalidate_caches() -> None:
+        """
+        Invalidate the cached validators and definitions of all `Schema` objects. This must be called
+        whenever a change is made that could alter the definition of an existing schema,
+        such as the declaration of a new registered subclass.
+        """
+        Schema.__cache_version__ += 1
+
     def validate(self, value: Any) -> None:
         """
         Determine whether a given object conforms to this schema, and throw an error if not.
 
         :param value: An object to test for validity against this schema
         """
-        jsonschema.validate(value, self.jsonschema_full_schema)
+        if instrumentation._enabled:
+            start = perf_counter()
+            try:
+                self._validate(value)
+            finally:
+                instrumentation.record(
+                    "validate", instrumentation.schema_key(self), perf_counter() - start
+                )
+        else:
+            self._validate(value)
+
+    def _validate(self, value: Any) -> None:
+        if not self.is_valid(value):
+            error = best_match(self.validator.iter_errors(value))
+            if error is not None:
+                raise error
+            raise ValidationError(
+                f"The supplied value does not conform to this schema: {value}"
+            )
+
+    def validate_deep(self, value: Any) -> None:
+        """
+        Determine whether a given object conforms to this schema, including the checks
+        that are otherwise only made when DOM elements are created from it, and throw an
+        error if not. These include validating the items of arrays and checking that
+        exactly one of the schemas in a :class:`~wysdom.SchemaAnyOf` matches.
+
+        :param value: An object to test for validity against this schema
+        """
+        self.validate(value)
+        self._validate_nested(value)
+
+    def _validate_nested(self, value: Any) -> None:
+        """
+        Make the checks for `validate_deep` that are not made by `validate`, for a
+        value that has already been validated against this schema.
+
+        :param value: An object that is known to be valid against this schema
+        """
+        pass
 
     def is_valid(self, value: Any) -> bool:
         """
@@ -116,6 +251,4 @@ class Schema(ABC):
         :param value: An object to test for validity against this schema
         :return:      True if the object is valid, otherwise False
         """
-        return validator_for(self.jsonschema_full_schema)(
-            self.jsonschema_full_schema
-        ).is_valid(value)
+        return self.validator.is_valid(value)
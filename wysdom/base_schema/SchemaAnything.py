@@ -11,3 +11,6 @@ class SchemaAnything(Schema):
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
         return {}
+
+    def is_valid(self, value: Any) -> bool:
+        return True
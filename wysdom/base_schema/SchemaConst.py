@@ -16,3 +16,9 @@ class SchemaConst(Schema):
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
         return {"const": self.value}
+
+    def is_valid(self, value: Any) -> bool:
+        # As in jsonschema, booleans are never equal to the integers 0 and 1
+        if isinstance(value, bool) or isinstance(self.value, bool):
+            return value is self.value
+        return value == self.value
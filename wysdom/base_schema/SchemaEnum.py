@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Tuple, Type
+from typing import Any, Dict, List, Tuple, Type, FrozenSet, Optional
 from enum import Enum
 
 from .Schema import Schema
@@ -13,26 +13,63 @@ class SchemaEnum(Schema):
 
     def __init__(self, enum: Type[Enum]) -> None:
         self.enum = enum
+        # Iterating over an Enum skips aliases, so each member only appears once
+        members = list(enum)
+        self._allowed_values = [member.value for member in members]
+        self._jsonschema_definition = {"enum": self._allowed_values}
+        self._members_by_key: Optional[Dict[Tuple[bool, Any], Enum]] = {}
+        try:
+            for member in members:
+                value_key = self._value_key(member.value)
+                if value_key in self._members_by_key:
+                    raise ValueError(
+                        f"Multiple ambiguous members in {self.enum} "
+                        f"with value {member.value}"
+                    )
+                self._members_by_key[value_key] = member
+        except TypeError:
+            self._members_by_key = None
+        self._value_keys: Optional[FrozenSet[Tuple[bool, Any]]] = (
+            None if self._members_by_key is None else frozenset(self._members_by_key)
+        )
 
     def __call__(self, value: Any, dom_info: Tuple = None) -> Any:
-        validated_value = super().__call__(value)
-        matched_enum_members = [
-            member
-            for member in self.enum.__members__.values()
-            if member.value == validated_value
-        ]
-        if len(matched_enum_members) == 0:
-            raise ValueError(f"Cannot find a member in {self.enum} with value {value}")
-        if len(matched_enum_members) > 1:
-            raise ValueError(
-                f"Multiple ambiguous members in {self.enum} with value {value}"
-            )
-        return matched_enum_members[0]
+        validated_value = super().__call__(value, dom_info)
+        if self._members_by_key is not None:
+            try:
+                member = self._members_by_key.get(self._value_key(validated_value))
+            except TypeError:
+                member = None
+            if member is not None:
+                return member
+        else:
+            # The enum has unhashable values, so they can only be compared one by one
+            for member in self.enum:
+                if member.value == validated_value:
+                    return member
+        raise ValueError(f"Cannot find a member in {self.enum} with value {value}")
+
+    @staticmethod
+    def _value_key(value: Any) -> Tuple[bool, Any]:
+        # As in jsonschema, booleans must not match the integers 0 and 1
+        return isinstance(value, bool), value
+
+    def is_valid(self, value: Any) -> bool:
+        if self._value_keys is None:
+            return super().is_valid(value)
+        try:
+            return self._value_key(value) in self._value_keys
+        except TypeError:
+            return value in self.allowed_values
 
     @property
     def allowed_values(self) -> List[Any]:
-        return [member.value for member in self.enum.__members__.values()]
+        """
+        The values of the members of the enum. The returned list is cached and
+        must not be modified.
+        """
+        return self._allowed_values
 
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
-        return {"enum": self.allowed_values}
+        return self._jsonschema_definition
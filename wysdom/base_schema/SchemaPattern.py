@@ -1,10 +1,32 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Pattern, Tuple
 
 import re
 
+from .. import instrumentation
+from ..trust import is_trusted
+
 from .SchemaPrimitive import SchemaPrimitive
 
 
+# Compiled regex patterns, shared by all SchemaPattern objects with the same pattern
+_compiled_patterns: Dict[str, Pattern] = {}
+
+
+def compile_pattern(pattern: str) -> Pattern:
+    """
+    Compile a regex pattern, or return the previously compiled pattern if it has
+    been compiled before. Unlike the cache used by the functions in the `re` module,
+    this cache is not limited in size.
+
+    :param pattern: A regex pattern
+    :return:        The compiled pattern
+    """
+    compiled_pattern = _compiled_patterns.get(pattern)
+    if compiled_pattern is None:
+        compiled_pattern = _compiled_patterns[pattern] = re.compile(pattern)
+    return compiled_pattern
+
+
 class SchemaPattern(SchemaPrimitive):
     """
     A schema requiring a match for a regex pattern.
@@ -15,14 +37,33 @@ class SchemaPattern(SchemaPrimitive):
     def __init__(self, pattern: str) -> None:
         super().__init__(python_type=str)
         self.pattern = pattern
+        self._compiled_pattern = compile_pattern(pattern)
 
     def __call__(self, value: str, dom_info: Tuple = None) -> Any:
-        if not re.match(self.pattern, value):
+        # The pattern is checked even if the value has already been validated, as
+        # jsonschema validation only requires a match anywhere in the value
+        if not is_trusted():
+            self._check_match(value)
+        return super().__call__(value, dom_info)
+
+    def _validate_nested(self, value: Any) -> None:
+        self._check_match(value)
+
+    def _check_match(self, value: str) -> None:
+        if not self._compiled_pattern.match(value):
             raise ValueError(
                 f"Parameter value {value} does not match regex pattern {self.pattern}."
             )
-        return super().__call__(value)
 
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
         return {"type": self.type_name, "pattern": self.pattern}
+
+    def is_valid(self, value: Any) -> bool:
+        # jsonschema uses re.search semantics for the "pattern" keyword
+        matched = (
+            isinstance(value, str) and self._compiled_pattern.search(value) is not None
+        )
+        if instrumentation._enabled:
+            instrumentation.record("pattern_match", self.pattern, int(matched))
+        return matched
@@ -23,7 +23,7 @@ class SchemaPrimitive(SchemaType):
         self.python_type = python_type
 
     def __call__(self, value: Any, dom_info: Tuple = None) -> Any:
-        return super().__call__(self.python_type(value))
+        return super().__call__(self.python_type(value), dom_info)
 
     @property
     def type_name(self) -> str:
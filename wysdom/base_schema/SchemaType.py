@@ -2,11 +2,56 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict
+
+from numbers import Number
 
 from .Schema import Schema
 
 
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, Number) and not isinstance(value, bool)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_null(value: Any) -> bool:
+    return value is None
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+# Type checks equivalent to those used by jsonschema for JSON Schema draft 7.
+# These are module-level functions so that schemas which store them can be pickled.
+JSON_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": _is_string,
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": _is_boolean,
+    "null": _is_null,
+    "object": _is_object,
+    "array": _is_array,
+}
+
+
 class SchemaType(Schema, ABC):
     """
     Abstract base class for any schema with the "type" keyword
@@ -23,3 +68,6 @@ class SchemaType(Schema, ABC):
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
         return {"type": self.type_name}
+
+    def is_valid(self, value: Any) -> bool:
+        return JSON_TYPE_CHECKS[self.type_name](value)
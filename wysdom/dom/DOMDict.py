@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar, Optional, Any, Dict
+from typing import Generic, TypeVar, Optional, Any
 
 from collections.abc import Mapping
+from weakref import WeakKeyDictionary
 
 from ..base_schema import Schema, SchemaAnything
+from ..exceptions import ValidationError
+from ..trust import is_trusted, in_batch
 from .DOMElement import DOMElement
 from .DOMObject import DOMObject
 from . import DOMInfo
@@ -13,39 +16,85 @@ from .DOMProperties import DOMProperties
 T_co = TypeVar("T_co")
 
 
+_ANY_ITEM_TYPE = SchemaAnything()
+_ANY_ITEM_PROPERTIES = DOMProperties(additional_properties=_ANY_ITEM_TYPE)
+_item_type_properties: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _dom_properties_for(
+    item_type: Optional[Schema], property_names: Optional[Schema] = None
+) -> DOMProperties:
+    """
+    Return a :class:`.DOMProperties` object for a :class:`DOMDict` with a given item
+    type and key schema, which is shared by all :class:`DOMDict` instances with that
+    item type and key schema.
+    """
+    if item_type is None:
+        if property_names is None:
+            return _ANY_ITEM_PROPERTIES
+        item_type = _ANY_ITEM_TYPE
+    properties_by_names = _item_type_properties.get(item_type)
+    if properties_by_names is None:
+        properties_by_names = _item_type_properties[item_type] = {}
+    dom_properties = properties_by_names.get(property_names)
+    if dom_properties is None:
+        dom_properties = DOMProperties(
+            additional_properties=item_type, property_names=property_names
+        )
+        properties_by_names[property_names] = dom_properties
+    return dom_properties
+
+
 class DOMDict(DOMObject, Generic[T_co]):
     """
     An object with dynamic properties (corresponding to a Python dict).
     """
 
+    __slots__ = ("__json_schema_properties__",)
+
     def __init__(
         self,
         value: Optional[Mapping[str, Any]] = None,
         json_dom_info: Optional[DOMInfo] = None,
         item_type: Optional[Schema] = None,
+        property_names: Optional[Schema] = None,
     ) -> None:
         """
-        :param value:         A dict (or any :class:`collections.abc.Mapping`) containing the data to populate this
-                              object's properties.
-        :param json_dom_info: A :class:`~wysdom.dom.DOMInfo` named tuple containing information about this object's
-                              position in the DOM.
-        :param item_type:     A :class:`~wysdom.Schema` object specifying what constitutes a valid property
-                              of this object.
+        :param value:          A dict (or any :class:`collections.abc.Mapping`) containing the data to populate this
+                               object's properties.
+        :param json_dom_info:  A :class:`~wysdom.dom.DOMInfo` named tuple containing information about this object's
+                               position in the DOM.
+        :param item_type:      A :class:`~wysdom.Schema` object specifying what constitutes a valid property
+                               of this object.
+        :param property_names: An optional :class:`~wysdom.Schema` object that the keys of this object
+                               must be valid against.
         """
-        self.__json_schema_properties__ = DOMProperties(
-            additional_properties=(item_type or SchemaAnything())
-        )
+        self.__json_schema_properties__ = _dom_properties_for(item_type, property_names)
         super().__init__(value or {}, json_dom_info)
 
     def __getitem__(self, key: str) -> T_co:
         return super().__getitem__(key)
 
-    def __deepcopy__(self, memo: Dict[int, DOMElement]) -> DOMDict:
-        cls = self.__class__
-        result = cls(
-            value=self.to_builtin(),
-            json_dom_info=self.__json_dom_info__,
-            _item_type=self.__json_schema_properties__.additional_properties,
-        )
-        memo[id(self)] = result
+    def __setitem__(self, key: str, value: T_co) -> None:
+        property_names = self.__json_schema_properties__.property_names
+        if (
+            property_names is not None
+            and not is_trusted()
+            and not in_batch(self)
+            and not property_names.is_valid(key)
+        ):
+            raise ValidationError(
+                f"The key '{key}' is not valid for this dict: "
+                f"it does not conform to {property_names}."
+            )
+        super().__setitem__(key, value)
+
+    def _lazy_copy(
+        self,
+        document: Optional[DOMElement],
+        parent: Optional[DOMElement],
+        element_key: Optional[str],
+    ) -> DOMDict:
+        result = super()._lazy_copy(document, parent, element_key)
+        result.__json_schema_properties__ = self.__json_schema_properties__
         return result
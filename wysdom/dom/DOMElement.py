@@ -1,11 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, Iterator, NamedTuple, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from enum import Enum
 
 from abc import ABC, abstractmethod
 
+from .. import instrumentation
 from ..base_schema import Schema, SchemaAnything
+from ..trust import in_batch
 
 
 # noinspection PyUnresolvedReferences
@@ -27,12 +39,68 @@ class DOMInfo(NamedTuple):
     element_key: Optional[str] = None
 
 
+class _BuildInfo(NamedTuple):
+    """
+    Used in place of a :class:`DOMInfo` when wysdom creates a DOM element, to pass
+    flags that control how the element is built. Its first fields are the same as
+    those of DOMInfo, so it can be used wherever a DOMInfo is expected.
+
+    :param validated: True if the value used to create a :class:`DOMElement` has
+                      already been validated against that element's schema (e.g. by
+                      an ancestor element), in which case it is not validated again.
+    :param lazy:      True if a :class:`DOMElement` should keep the raw values of its
+                      children and only create child elements when they are first
+                      accessed. The whole value is still validated when the element
+                      is created.
+    :param owned:     True if the value was created by wysdom (e.g. decoded from JSON)
+                      and is not referenced anywhere else, so that a lazy element can
+                      keep the dicts and lists within it without copying them.
+    """
+
+    element: Optional[DOMElement] = None
+    document: Optional[DOMElement] = None
+    parent: Optional[DOMElement] = None
+    element_key: Optional[str] = None
+    validated: bool = False
+    lazy: bool = False
+    owned: bool = False
+
+
+class _LazyData:
+    """
+    The raw data of a child element that a lazy element has not created yet.
+    The data is never modified, so it can be shared with copies of the element.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+
+_ANY_SCHEMA = SchemaAnything()
+
+
 class DOMElement(ABC):
     """
     Abstract base class for any DOM element.
+
+    DOM elements store their position in the DOM in slots rather than in an
+    instance `__dict__`. Subclasses which do not need any other instance
+    attributes may declare `__slots__ = ()` to keep their instances compact.
     """
 
-    __json_dom_info__: DOMInfo = None
+    __slots__ = (
+        "__json_dom_document__",
+        "__json_dom_parent__",
+        "__json_dom_element_key__",
+        "__json_cache__",
+        "__json_path_index__",
+        "__weakref__",
+    )
 
     @abstractmethod
     def __init__(
@@ -48,21 +116,44 @@ class DOMElement(ABC):
             raise ValueError(
                 "The parameter 'value' must be handled by a non-abstract subclass."
             )
+        if instrumentation._enabled:
+            instrumentation.record("construct", instrumentation.class_key(type(self)))
+        # Cached serialization of this element, or None if there is none or if the
+        # element has changed since it was cached
+        self.__json_cache__ = None
+        # Index of the JSON pointers of the elements in this document, if this element
+        # is a document and the index has been built
+        self.__json_path_index__ = None
         if json_dom_info:
-            self.__json_dom_info__ = DOMInfo(
-                element=self,
-                document=(
-                    self if json_dom_info.document is None else json_dom_info.document
-                ),
-                parent=json_dom_info.parent,
-                element_key=json_dom_info.element_key,
+            # A document of None is stored for elements that are their own document,
+            # to avoid a reference cycle
+            self.__json_dom_document__ = (
+                None if json_dom_info.document is self else json_dom_info.document
             )
+            self.__json_dom_parent__ = json_dom_info.parent
+            self.__json_dom_element_key__ = json_dom_info.element_key
         else:
-            self.__json_dom_info__ = DOMInfo(element=self, document=self)
+            self.__json_dom_document__ = None
+            self.__json_dom_parent__ = None
+            self.__json_dom_element_key__ = None
+
+    @property
+    def __json_dom_info__(self) -> DOMInfo:
+        """
+        A :class:`~wysdom.dom.DOMInfo` named tuple containing information about this
+        element's position in the DOM.
+        """
+        document = self.__json_dom_document__
+        return DOMInfo(
+            element=self,
+            document=self if document is None else document,
+            parent=self.__json_dom_parent__,
+            element_key=self.__json_dom_element_key__,
+        )
 
     @classmethod
     def __json_schema__(cls) -> Schema:
-        return SchemaAnything()
+        return _ANY_SCHEMA
 
     @abstractmethod
     def to_builtin(self) -> Any:
@@ -72,15 +163,86 @@ class DOMElement(ABC):
         """
         pass
 
+    def _element_changed(self) -> None:
+        """
+        Must be called whenever the contents of this element are changed. Discards
+        the cached serialization of this element and of all of its ancestors.
+        """
+        element = self
+        while element is not None:
+            element.__json_cache__ = None
+            element = element.__json_dom_parent__
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> DOMElement:
+        """
+        Returns a deep copy of this element, in the same position in the DOM as this
+        element (or its own document if this element is), without validating or
+        converting its data again. Child elements that have been created are copied
+        one by one, and the raw data of those that a lazy element has not created
+        yet is shared with the copy, since it is never changed in place. The DOM is
+        traversed iteratively, so that there is no limit on the depth of the data.
+        """
+        result = self._lazy_copy(
+            self.__json_dom_document__,
+            self.__json_dom_parent__,
+            self.__json_dom_element_key__,
+        )
+        memo[id(self)] = result
+        # Copies whose data still contains the original's child elements
+        stack = [result]
+        while stack:
+            element_copy = stack.pop()
+            data = element_copy.__json_element_data__
+            document = element_copy.__json_dom_document__
+            if document is None:
+                document = element_copy
+            keyed = type(data) is dict
+            for key in data.keys() if keyed else range(len(data)):
+                child = data[key]
+                if type(child) in _LEAF_TYPES or type(child) is _LazyData:
+                    continue
+                elif isinstance(child, DOMElement):
+                    child_copy = child._lazy_copy(
+                        document, element_copy, key if keyed else None
+                    )
+                    data[key] = child_copy
+                    stack.append(child_copy)
+                elif type(child) is dict or type(child) is list:
+                    data[key] = element_to_builtin(child)
+        return result
+
+    def _lazy_copy(
+        self,
+        document: Optional[DOMElement],
+        parent: Optional[DOMElement],
+        element_key: Optional[str],
+    ) -> DOMElement:
+        """
+        Returns a copy of this element at a given position in the DOM, whose data is
+        a shallow copy of this element's data. Used by `__deepcopy__`, which then
+        copies the child elements within it.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        if instrumentation._enabled:
+            instrumentation.record("construct", instrumentation.class_key(cls))
+        result.__json_cache__ = self.__json_cache__
+        result.__json_path_index__ = None
+        result.__json_dom_document__ = document
+        result.__json_dom_parent__ = parent
+        result.__json_dom_element_key__ = element_key
+        return result
+
     def walk_elements(self) -> Iterator[DOMInfo]:
         """
         Walk through the full tree structure within this DOM element.
         Returns an iterator of :class:`~wysdom.dom.DOMInfo` tuples in the form
-        (element, document, parent element_key).
+        (element, document, parent element_key). See :func:`walk` for more
+        ways to control the traversal.
 
         :return: An iterator of :class:`~wysdom.dom.DOMInfo` tuples.
         """
-        yield self.__json_dom_info__
+        return walk(self)
 
     @staticmethod
     def _value_to_builtin(value: Any) -> Any:
@@ -88,9 +250,187 @@ class DOMElement(ABC):
         Returns the contents of any DOMElement Python builtin. Return type
         varies depending on the specific object type.
         """
-        if isinstance(value, DOMElement):
-            return value.to_builtin()
-        elif isinstance(value, Enum):
+        if isinstance(value, Enum):
             return value.value
+        elif (
+            isinstance(value, DOMElement)
+            or DOMElement._is_raw_container(value)
+            or DOMElement._is_lazy_data(value)
+        ):
+            return element_to_builtin(value)
         else:
             return value
+
+    def _defers_validation(self, value: Any) -> bool:
+        """
+        Returns True if a new child value of this element need not be validated when
+        it is set, because this element is being changed within :func:`wysdom.batch`
+        and is validated when the batch ends. Only scalar values are deferred, since
+        creating a child element from a container converts the values within it.
+        """
+        return isinstance(value, (str, int, float, Enum)) and in_batch(self)
+
+    @staticmethod
+    def _is_raw_container(value: Any) -> bool:
+        """
+        Returns True if a child value is a raw dict or list that has been stored
+        without being wrapped in a DOM element, e.g. by a schema that accepts
+        any value. Unlike lazy data, such a container can be changed in place.
+        """
+        return type(value) is dict or type(value) is list
+
+    @staticmethod
+    def _is_lazy_data(value: Any) -> bool:
+        """
+        Returns True if a child value is the raw data of a child element that a
+        lazy element has not created yet.
+        """
+        return type(value) is _LazyData
+
+    @staticmethod
+    def _lazy_data(value: Any, owned: bool) -> _LazyData:
+        """
+        Returns a raw dict or list for a lazy element to keep in place of a child
+        element. Data that the caller may still change is copied, so that the
+        element does not change with it.
+        """
+        return _LazyData(value if owned else element_to_builtin(value))
+
+
+def element_data(value: Any) -> Any:
+    """
+    Returns the underlying data of a DOM element without copying or converting
+    it, so that it can be traversed: a dict for a :class:`~wysdom.dom.DOMObject`
+    and a list for a :class:`~wysdom.dom.DOMList`. Values of any other type are
+    converted to a Python builtin. The data must not be modified.
+
+    :param value: A DOM element, or any value contained in one
+    :return:      A dict, list or other Python builtin
+    """
+    if isinstance(value, DOMElement):
+        data = getattr(value, "__json_element_data__", None)
+        return value.to_builtin() if data is None else data
+    elif isinstance(value, Enum):
+        return value.value
+    elif type(value) is _LazyData:
+        return value.data
+    else:
+        return value
+
+
+def element_to_builtin(value: Any) -> Any:
+    """
+    Returns a copy of a DOM element, or any value contained in one, as a Python
+    builtin. The DOM is traversed iteratively, so that there is no limit on the
+    depth of the data other than available memory.
+
+    :param value: A DOM element, or any value contained in one
+    :return:      A Python builtin containing a copy of the data
+    """
+    root = [value]
+    # Containers whose items still need to be converted, once they have been copied
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        keys = container.keys() if type(container) is dict else range(len(container))
+        for key in keys:
+            item = container[key]
+            if type(item) in _LEAF_TYPES:
+                continue
+            item = element_data(item)
+            if type(item) is dict:
+                item = dict(item)
+                stack.append(item)
+            elif type(item) is list:
+                item = list(item)
+                stack.append(item)
+            container[key] = item
+    return root[0]
+
+
+# Types which never need to be converted or traversed by element_to_builtin
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def walk(
+    element: DOMElement,
+    enter: Optional[Callable[[DOMInfo], Optional[bool]]] = None,
+    leave: Optional[Callable[[DOMInfo], None]] = None,
+    types: Union[Type, Tuple[Type, ...], None] = None,
+    include_values: bool = True,
+) -> Iterator[DOMInfo]:
+    """
+    Walk depth first through the tree structure within a DOM element, in document
+    order, yielding a :class:`~wysdom.dom.DOMInfo` tuple for the element itself and
+    for each element and primitive value within it. The tree is traversed with an
+    explicit stack rather than recursion, so that there is no limit on its depth.
+
+    :param element:        The DOM element to walk through.
+    :param enter:          A function which is called with the DOMInfo tuple of each
+                           element or value before it is yielded. If it returns False,
+                           the children of that element are skipped.
+    :param leave:          A function which is called with the DOMInfo tuple of each
+                           element or value after all of its children have been
+                           walked through (or skipped).
+    :param types:          A class or tuple of classes, such as a subclass of
+                           :class:`~wysdom.UserObject`, :class:`~wysdom.dom.DOMList` or
+                           `str`. If given, only elements and values which are
+                           instances of these classes are yielded and passed to
+                           `enter` and `leave`, but the children of other elements are
+                           still walked through.
+    :param include_values: If False, primitive values are skipped and only DOM
+                           elements are yielded.
+    :return:               An iterator of :class:`~wysdom.dom.DOMInfo` tuples.
+    """
+    # The stack holds DOM elements still to be walked through, DOMInfo tuples of
+    # primitive values still to be yielded, and the DOMInfo tuples of elements to
+    # be passed to `leave`, wrapped in a 1-tuple
+    stack = [element]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        item = pop()
+        if type(item) is DOMInfo:
+            if enter is not None:
+                enter(item)
+            yield item
+            if leave is not None:
+                leave(item)
+            continue
+        elif type(item) is tuple:
+            leave(item[0])
+            continue
+        document = item.__json_dom_document__
+        if document is None:
+            document = item
+        if types is None or isinstance(item, types):
+            info = DOMInfo(
+                item, document, item.__json_dom_parent__, item.__json_dom_element_key__
+            )
+            if enter is not None and enter(info) is False:
+                yield info
+                if leave is not None:
+                    leave(info)
+                continue
+            yield info
+            if leave is not None:
+                push((info,))
+        data = getattr(item, "__json_element_data__", None)
+        if type(data) is dict:
+            keys = list(data)
+            keys.reverse()
+            keyed = True
+        elif type(data) is list:
+            keys = range(len(data) - 1, -1, -1)
+            keyed = False
+        else:
+            continue
+        for key in keys:
+            value = data[key]
+            if type(value) is _LazyData:
+                # A raw child value of a lazy element, which must be wrapped first
+                value = item[key]
+            if isinstance(value, DOMElement):
+                push(value)
+            elif include_values and (types is None or isinstance(value, types)):
+                push(DOMInfo(value, document, item, key if keyed else None))
@@ -11,17 +11,17 @@ from typing import (
     Optional,
     Any,
     Iterable,
-    Dict,
     List,
-    Iterator,
     overload,
 )
 
 from ..base_schema import Schema
 from ..exceptions import ValidationError
 
-from .DOMElement import DOMElement
+from .DOMElement import DOMElement, element_to_builtin
 from . import DOMInfo
+from .DOMElement import _BuildInfo
+from .DOMPathIndex import get_path_index
 from .functions import document
 
 T_co = TypeVar("T_co")
@@ -32,7 +32,10 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
     An array element (corresponding to a Python list).
     """
 
-    __json_element_data__: List[DOMElement] = None
+    __slots__ = ("__json_element_data__", "item_type")
+
+    __json_element_data__: List[DOMElement]
+    item_type: Schema
 
     def __init__(
         self,
@@ -55,7 +58,18 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
         self.__json_element_data__ = []
         if item_type is not None:
             self.item_type = item_type
-        self[:] = value
+        if getattr(json_dom_info, "lazy", False) and getattr(
+            json_dom_info, "validated", False
+        ):
+            owned = getattr(json_dom_info, "owned", False)
+            self.__json_element_data__ = [
+                self._lazy_data(item, owned)
+                if self._is_raw_container(item)
+                else self._new_child_item(item, validated=True)
+                for item in value
+            ]
+        else:
+            self.__json_element_data__ = [self._new_child_item(x) for x in value]
 
     @overload
     @abstractmethod
@@ -68,7 +82,19 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
         ...
 
     def __getitem__(self, i: Union[int, slice]) -> Union[T_co, MutableSequence[T_co]]:
-        return self.__json_element_data__[i]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        value = self.__json_element_data__[i]
+        if self._is_lazy_data(value):
+            value = self._new_child_item(
+                value.data, validated=True, lazy=True, owned=True
+            )
+            if self._is_raw_container(value):
+                # A schema that accepts any value returns the data itself, which
+                # may be shared with copies of this list
+                value = element_to_builtin(value)
+            self.__json_element_data__[i] = value
+        return value
 
     @overload
     @abstractmethod
@@ -83,13 +109,49 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
     def __setitem__(
         self, i: Union[int, slice], o: Union[T_co, MutableSequence[T_co]]
     ) -> None:
-        if type(i) is int:
-            self.__json_element_data__[i] = self._new_child_item(o)
+        path_index = get_path_index(self)
+        if path_index is None:
+            if type(i) is int:
+                self.__json_element_data__[i] = self._new_child_item(
+                    o, self._defers_validation(o)
+                )
+            else:
+                self.__json_element_data__[i] = (
+                    self._new_child_item(x, self._defers_validation(x)) for x in o
+                )
+        elif type(i) is int:
+            position = range(len(self))[i]
+            old_item = self.__json_element_data__[position]
+            self.__json_element_data__[position] = self._new_child_item(
+                o, self._defers_validation(o)
+            )
+            path_index.replace_children(self, [old_item], [position])
         else:
-            self.__json_element_data__[i] = (self._new_child_item(x) for x in o)
+            start = self._first_position(i)
+            old_items = self.__json_element_data__[start:]
+            self.__json_element_data__[i] = (
+                self._new_child_item(x, self._defers_validation(x)) for x in o
+            )
+            path_index.replace_children(self, old_items, range(start, len(self)))
+        self._element_changed()
 
-    def _new_child_item(self, item: Any) -> DOMElement:
-        return self.item_type(item, DOMInfo(document=document(self), parent=self))
+    def _new_child_item(
+        self,
+        item: Any,
+        validated: bool = False,
+        lazy: bool = False,
+        owned: bool = False,
+    ) -> DOMElement:
+        return self.item_type(
+            item,
+            _BuildInfo(
+                document=document(self),
+                parent=self,
+                validated=validated,
+                lazy=lazy,
+                owned=owned,
+            ),
+        )
 
     @overload
     @abstractmethod
@@ -101,8 +163,16 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
     def __delitem__(self, i: slice) -> None:
         ...
 
-    def __delitem__(self, i: int) -> None:
-        del self.__json_element_data__[i]
+    def __delitem__(self, i: Union[int, slice]) -> None:
+        path_index = get_path_index(self)
+        if path_index is None:
+            del self.__json_element_data__[i]
+        else:
+            start = self._first_position(i)
+            old_items = self.__json_element_data__[start:]
+            del self.__json_element_data__[i]
+            path_index.replace_children(self, old_items, range(start, len(self)))
+        self._element_changed()
 
     def __len__(self) -> int:
         return len(self.__json_element_data__)
@@ -114,7 +184,26 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
         return str(self.__json_element_data__)
 
     def insert(self, index: int, item: Any) -> None:
-        self.__json_element_data__.insert(index, self._new_child_item(item))
+        new_item = self._new_child_item(item, self._defers_validation(item))
+        path_index = get_path_index(self)
+        if path_index is None:
+            self.__json_element_data__.insert(index, new_item)
+        else:
+            start = min(max(index + len(self) if index < 0 else index, 0), len(self))
+            old_items = self.__json_element_data__[start:]
+            self.__json_element_data__.insert(start, new_item)
+            path_index.replace_children(self, old_items, range(start, len(self)))
+        self._element_changed()
+
+    def _first_position(self, i: Union[int, slice]) -> int:
+        """
+        Return the first position in this list that is affected by replacing or
+        deleting the items at index or slice `i`.
+        """
+        positions = range(len(self))[i]
+        if type(positions) is int:
+            return positions
+        return min(positions) if positions else min(positions.start, len(self))
 
     def to_builtin(self) -> List[Any]:
         """
@@ -122,26 +211,19 @@ class DOMList(DOMElement, MutableSequence, Generic[T_co]):
 
         :return: A Python list containing this object's data
         """
-        return list(map(self._value_to_builtin, self))
-
-    def walk_elements(self) -> Iterator[DOMInfo]:
-        yield self.__json_dom_info__
-        for value in self:
-            if isinstance(value, DOMElement):
-                yield from value.walk_elements()
-            else:
-                yield DOMInfo(value, document(self), self, None)
+        return element_to_builtin(self)
 
     def __copy__(self) -> DOMList:
         cls = self.__class__
         return cls(list(self))
 
-    def __deepcopy__(self, memo: Dict[int, DOMElement]) -> DOMList:
-        cls = self.__class__
-        result = cls(
-            value=self.to_builtin(),
-            json_dom_info=self.__json_dom_info__,
-            _item_type=self.item_type,
-        )
-        memo[id(self)] = result
+    def _lazy_copy(
+        self,
+        document: Optional[DOMElement],
+        parent: Optional[DOMElement],
+        element_key: Optional[str],
+    ) -> DOMList:
+        result = super()._lazy_copy(document, parent, element_key)
+        result.item_type = self.item_type
+        result.__json_element_data__ = list(self.__json_element_data__)
         return result
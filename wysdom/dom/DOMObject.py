@@ -6,10 +6,13 @@ from collections.abc import Mapping, MutableMapping
 
 from ..exceptions import ValidationError
 from ..base_schema import SchemaAnything
+from ..trust import is_trusted
 
-from .DOMElement import DOMElement
+from .DOMElement import DOMElement, element_to_builtin
 from . import DOMInfo
+from .DOMElement import _BuildInfo
 from .DOMProperties import DOMProperties
+from .DOMPathIndex import get_path_index
 from .functions import document, schema
 
 
@@ -18,8 +21,10 @@ class DOMObject(DOMElement, MutableMapping):
     An object with named properties.
     """
 
+    __slots__ = ("__json_element_data__",)
+
     __json_schema_properties__: DOMProperties = None
-    __json_element_data__: Dict[str, Optional[DOMElement]] = None
+    __json_element_data__: Dict[str, Optional[DOMElement]]
 
     def __init__(
         self, value: Mapping[str, Any] = None, json_dom_info: DOMInfo = None
@@ -34,19 +39,78 @@ class DOMObject(DOMElement, MutableMapping):
             raise ValidationError(
                 f"Cannot validate input. Object is not a mapping: {value}"
             )
-        schema(self).validate(value)
+        validated = getattr(json_dom_info, "validated", False) or is_trusted()
+        lazy = getattr(json_dom_info, "lazy", False)
+        owned = getattr(json_dom_info, "owned", False)
+        if not validated:
+            element_schema = schema(self)
+            if lazy:
+                element_schema.validate_deep(value)
+            else:
+                element_schema.validate(value)
+            validated = not isinstance(element_schema, SchemaAnything)
+        lazy = lazy and validated
         super().__init__(None, json_dom_info)
-        self.__json_element_data__ = {}
+        element_data = self.__json_element_data__ = {}
+        scalar_converters = (
+            self.__json_schema_properties__.scalar_converters if validated else {}
+        )
         try:
             for key, value in value.items():
-                self[key] = value
+                convert = scalar_converters.get(key)
+                if convert is not None and value is not None:
+                    element_data[key] = convert(value)
+                elif lazy and self._is_raw_container(value):
+                    element_data[key] = self._lazy_data(value, owned)
+                else:
+                    self._set_item(key, value, validated, lazy)
         except KeyError as e:
             raise ValidationError(str(e))
 
     def __getitem__(self, key: str) -> Optional[DOMElement]:
-        return self.__json_element_data__[key]
+        value = self.__json_element_data__[key]
+        if self._is_lazy_data(value):
+            self._set_item(key, value.data, validated=True, lazy=True, owned=True)
+            value = self.__json_element_data__[key]
+            if self._is_raw_container(value):
+                # A schema that accepts any value returns the data itself, which
+                # may be shared with copies of this element
+                value = self.__json_element_data__[key] = element_to_builtin(value)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.__json_element_data__
 
     def __setitem__(self, key: str, value: Optional[DOMElement]) -> None:
+        validated = self._defers_validation(value)
+        path_index = get_path_index(self)
+        if path_index is None:
+            self._set_item(key, value, validated)
+        else:
+            old_value = self.__json_element_data__.get(key)
+            self._set_item(key, value, validated)
+            path_index.replace_children(self, [old_value], [key])
+        self._element_changed()
+
+    def _set_item(
+        self,
+        key: str,
+        value: Any,
+        validated: bool = False,
+        lazy: bool = False,
+        owned: bool = False,
+    ) -> None:
+        """
+        Set the value of a property, creating a DOM element for it if necessary.
+
+        :param key:       The name of the property.
+        :param value:     The raw value of the property.
+        :param validated: True if `value` has already been validated against this
+                          object's schema, so the new child element can skip validation.
+        :param lazy:      True if the new child element should be lazy.
+        :param owned:     True if `value` is not referenced outside of wysdom, so that
+                          a lazy child element need not copy it.
+        """
         if value is None:
             if key in self.__json_schema_properties__.required:
                 raise ValueError(
@@ -65,11 +129,23 @@ class DOMObject(DOMElement, MutableMapping):
                     "additional properties are not allowed."
                 )
             self.__json_element_data__[key] = item_class(
-                value, DOMInfo(document=document(self), parent=self, element_key=key)
+                value,
+                _BuildInfo(
+                    document=document(self),
+                    parent=self,
+                    element_key=key,
+                    validated=validated,
+                    lazy=lazy,
+                    owned=owned,
+                ),
             )
 
     def __delitem__(self, key: str) -> None:
-        del self.__json_element_data__[key]
+        old_value = self.__json_element_data__.pop(key)
+        path_index = get_path_index(self)
+        if path_index is not None:
+            path_index.replace_children(self, [old_value], [])
+        self._element_changed()
 
     def __len__(self) -> int:
         return len(self.__json_element_data__)
@@ -83,21 +159,13 @@ class DOMObject(DOMElement, MutableMapping):
     def __str__(self):
         return str(self.__json_element_data__)
 
-    def walk_elements(self) -> Iterator[DOMInfo]:
-        yield self.__json_dom_info__
-        for key, value in self.items():
-            if isinstance(value, DOMElement):
-                yield from value.walk_elements()
-            else:
-                yield DOMInfo(value, document(self), self, key)
-
     def to_builtin(self) -> Dict[str, Any]:
         """
         Returns the contents of this DOM object as a Python builtin.
 
         :return: A Python dict containing this object's data
         """
-        return {k: self._value_to_builtin(v) for k, v in self.items()}
+        return element_to_builtin(self)
 
     def __copy__(self) -> DOMObject:
         cls = self.__class__
@@ -106,8 +174,12 @@ class DOMObject(DOMElement, MutableMapping):
         result.__json_element_data__ = dict(self.__json_element_data__)
         return result
 
-    def __deepcopy__(self, memo: Dict[int, DOMElement]) -> DOMObject:
-        cls = self.__class__
-        result = cls(value=self.to_builtin(), json_dom_info=self.__json_dom_info__)
-        memo[id(self)] = result
+    def _lazy_copy(
+        self,
+        document: Optional[DOMElement],
+        parent: Optional[DOMElement],
+        element_key: Optional[str],
+    ) -> DOMObject:
+        result = super()._lazy_copy(document, parent, element_key)
+        result.__json_element_data__ = self.__json_element_data__.copy()
         return result
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+from collections.abc import Mapping
+
+from .DOMElement import DOMElement
+
+
+def escape_pointer_token(token: Any) -> str:
+    """
+    Escape a key or list index for use as a reference token in a JSON pointer.
+
+    :param token: A key or list index
+    :return:      The escaped reference token
+    """
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def unescape_pointer_token(token: str) -> str:
+    """
+    Unescape a reference token from a JSON pointer.
+
+    :param token: An escaped reference token
+    :return:      The key or list index that it refers to, as a string
+    """
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class DOMPathIndex(object):
+    """
+    An index of the JSON pointers (see RFC 6901) and of the classes of all of the
+    DOM elements in a document, for resolving pointers, finding the pointers of
+    elements and finding the instances of a class in time proportional to the
+    size of the result.
+
+    The index is built when it is first needed, and the whole document is
+    materialized when it is built. It is then kept up to date as the document
+    is changed: when the children of an element are replaced, only the replaced
+    children and their descendants (and, for lists, any later items, whose
+    positions have changed) are indexed again.
+
+    :param document: The document to index
+    """
+
+    def __init__(self, document: DOMElement) -> None:
+        self.document = document
+        self._elements: Dict[str, DOMElement] = {}
+        self._pointers: Dict[int, str] = {}
+        self._instances: Dict[type, Dict[int, DOMElement]] = {}
+        self._add(document, "")
+
+    @classmethod
+    def for_document(cls, document: DOMElement) -> DOMPathIndex:
+        """
+        Return the path index of a document, building it if it does not exist.
+
+        :param document: A document, i.e. a DOM element without a parent
+        :return:         The path index of the document
+        """
+        path_index = document.__json_path_index__
+        if path_index is None:
+            path_index = document.__json_path_index__ = cls(document)
+        return path_index
+
+    def resolve(self, pointer: str) -> Any:
+        """
+        Return the value in the document that a JSON pointer refers to. The value
+        may be a DOM element or a primitive value.
+
+        :param pointer: A JSON pointer, such as "/pets/3/name"
+        :return:        The value that `pointer` refers to
+        :raises KeyError: If `pointer` does not refer to any value in the document
+        """
+        element = self._elements.get(pointer)
+        if element is not None:
+            return element
+        if pointer and pointer[0] != "/":
+            raise KeyError(f"Invalid JSON pointer: {pointer!r}")
+        # The value is not a DOM element (e.g. a primitive value), so look it
+        # up from its nearest ancestor which is a DOM element
+        tokens = []
+        prefix = pointer
+        while element is None:
+            prefix, token = prefix.rsplit("/", 1)
+            tokens.append(unescape_pointer_token(token))
+            element = self._elements.get(prefix)
+        value = element
+        for token in reversed(tokens):
+            value = _child(value, token, pointer)
+        return value
+
+    def path_of(self, element: DOMElement) -> str:
+        """
+        Return the JSON pointer of a DOM element in the document.
+
+        :param element: A DOM element in the document
+        :return:        The JSON pointer that refers to `element`
+        :raises ValueError: If `element` is not part of the document
+        """
+        pointer = self._pointers.get(id(element))
+        if pointer is None or self._elements.get(pointer) is not element:
+            raise ValueError(f"The element is not part of this document: {element}")
+        return pointer
+
+    def instances_of(self, cls: Union[Type, str]) -> List[DOMElement]:
+        """
+        Return the elements in the document which are instances of a class.
+
+        :param cls: A class, or the registered name of a subclass of
+                    :class:`~wysdom.mixins.RegistersSubclasses`
+        :return:    The instances of `cls` (or of the classes registered with
+                    that name) in the document, in no particular order
+        """
+        if isinstance(cls, str):
+            matches = [
+                element_class
+                for element_class in self._instances
+                if any(
+                    superclass.__dict__.get("registered_name") == cls
+                    for superclass in element_class.__mro__
+                )
+            ]
+        else:
+            matches = [
+                element_class
+                for element_class in self._instances
+                if issubclass(element_class, cls)
+            ]
+        instances = []
+        for element_class in matches:
+            instances.extend(self._instances[element_class].values())
+        return instances
+
+    def replace_children(
+        self,
+        parent: DOMElement,
+        old_children: Iterable[Any],
+        keys: Iterable[Any],
+    ) -> None:
+        """
+        Update the index after some of the children of an element in the document
+        have been replaced.
+
+        :param parent:       The element whose children have been replaced
+        :param old_children: The children that are no longer at their previous positions
+        :param keys:         The keys or list indexes of the children that have been added
+                             or moved, as they are after the change
+        """
+        parent_pointer = self._pointers.get(id(parent))
+        if parent_pointer is None or self._elements.get(parent_pointer) is not parent:
+            return
+        for old_child in old_children:
+            if isinstance(old_child, DOMElement):
+                self._remove(old_child)
+        for key in keys:
+            child = parent[key]
+            if isinstance(child, DOMElement):
+                self._add(child, f"{parent_pointer}/{escape_pointer_token(key)}")
+
+    def _add(self, element: DOMElement, pointer: str) -> None:
+        elements = self._elements
+        pointers = self._pointers
+        instances = self._instances
+        stack = [(element, pointer)]
+        while stack:
+            element, pointer = stack.pop()
+            elements[pointer] = element
+            pointers[id(element)] = pointer
+            element_class = type(element)
+            if element_class in instances:
+                instances[element_class][id(element)] = element
+            else:
+                instances[element_class] = {id(element): element}
+            children = (
+                element.items() if isinstance(element, Mapping) else enumerate(element)
+            )
+            for key, child in children:
+                if isinstance(child, DOMElement):
+                    stack.append((child, f"{pointer}/{escape_pointer_token(key)}"))
+
+    def _remove(self, element: DOMElement) -> None:
+        elements = self._elements
+        pointers = self._pointers
+        instances = self._instances
+        stack = [element]
+        while stack:
+            element = stack.pop()
+            pointer = pointers.pop(id(element), None)
+            if pointer is not None and elements.get(pointer) is element:
+                del elements[pointer]
+            class_instances = instances.get(type(element))
+            if (
+                class_instances is not None
+                and class_instances.get(id(element)) is element
+            ):
+                del class_instances[id(element)]
+                if not class_instances:
+                    del instances[type(element)]
+            stack.extend(
+                child
+                for child in (
+                    element.values() if isinstance(element, Mapping) else element
+                )
+                if isinstance(child, DOMElement)
+            )
+
+
+def _child(value: Any, token: str, pointer: str) -> Any:
+    try:
+        if isinstance(value, Mapping):
+            return value[token]
+        if isinstance(value, (list, DOMElement)) and token.isdigit():
+            return value[int(token)]
+    except (KeyError, IndexError):
+        pass
+    raise KeyError(f"No value exists for JSON pointer: {pointer!r}")
+
+
+def get_path_index(element: DOMElement) -> Optional[DOMPathIndex]:
+    """
+    Return the path index of the document that a DOM element belongs to, if it
+    has been built.
+
+    :param element: A DOM element
+    :return:        The path index, or None if none has been built
+    """
+    document = element.__json_dom_document__
+    return (element if document is None else document).__json_path_index__
@@ -1,6 +1,20 @@
-from typing import Dict, Union, Set
+from typing import Any, Callable, Dict, Union, Set, Optional
 
-from ..base_schema import Schema
+from functools import partial
+
+from ..base_schema import (
+    Schema,
+    SchemaPrimitive,
+    SchemaEnum,
+    SchemaConst,
+    SchemaNone,
+)
+
+from .DOMElement import _BuildInfo
+
+# Schemas whose values are never DOM elements or containers, so that they do not
+# need to know their position in the DOM
+SCALAR_SCHEMAS = (SchemaPrimitive, SchemaEnum, SchemaConst, SchemaNone)
 
 
 # TODO: DRY with object_schema.SchemaObject?
@@ -14,12 +28,15 @@ class DOMProperties(object):
     properties: Dict[str, Schema] = None
     required: Set[str] = None
     additional_properties: Union[bool, Schema] = False
+    property_names: Optional[Schema] = None
+    scalar_converters: Dict[str, Callable[[Any], Any]] = None
 
     def __init__(
         self,
         properties: Dict[str, Schema] = None,
         required: Set[str] = None,
         additional_properties: Union[bool, Schema] = False,
+        property_names: Optional[Schema] = None,
     ) -> None:
         """
         :param properties:            A dictionary of :class:`~wysdom.base_schema.Schema` objects
@@ -30,7 +47,29 @@ class DOMProperties(object):
                                       dynamically-named properties. Can be True or False, or
                                       can be set to a specific :class:`~wysdom.Schema` to restrict the permitted
                                       types of any additional properties.
+        :param property_names:        An optional :class:`~wysdom.Schema` that the names of
+                                      any additional properties must be valid against.
+
+        `scalar_converters` is derived from `properties`, and holds a function for each
+        property with a scalar schema (such as `str` or an enum) that converts a value
+        which has already been validated directly into the property's Python value.
         """
         self.properties = properties or {}
         self.required = required or set()
         self.additional_properties = additional_properties
+        self.property_names = property_names
+        self.scalar_converters = {
+            name: _scalar_converter(schema)
+            for name, schema in self.properties.items()
+            if isinstance(schema, SCALAR_SCHEMAS)
+        }
+
+
+def _scalar_converter(schema: Schema) -> Callable[[Any], Any]:
+    """
+    Return a function that converts a value which has already been validated
+    against a scalar schema into its Python value.
+    """
+    if type(schema) is SchemaPrimitive:
+        return schema.python_type
+    return partial(schema, dom_info=_BuildInfo(validated=True))
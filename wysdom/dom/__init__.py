@@ -1,6 +1,15 @@
 from .DOMProperties import DOMProperties
-from .DOMElement import DOMElement, DOMInfo
+from .DOMElement import DOMElement, DOMInfo, walk
 from .DOMObject import DOMObject
 from .DOMDict import DOMDict
 from .DOMList import DOMList
-from .functions import document, parent, key, schema
+from .functions import (
+    document,
+    parent,
+    key,
+    schema,
+    path_of,
+    resolve,
+    get_many,
+    instances_of,
+)
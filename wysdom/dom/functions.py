@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Any, Iterable, List, Optional, Type, Union
 
 from ..base_schema import Schema
 from .DOMElement import DOMElement
+from .DOMPathIndex import DOMPathIndex
 from . import DOMInfo
 
 
@@ -23,7 +24,8 @@ def document(element: DOMElement) -> Optional[DOMElement]:
     :param element: A DOM element
     :return:        The owning document for that DOM element, or None if none exists
     """
-    return dom(element).document
+    document_element = element.__json_dom_document__
+    return element if document_element is None else document_element
 
 
 def parent(element: DOMElement) -> Optional[DOMElement]:
@@ -33,7 +35,7 @@ def parent(element: DOMElement) -> Optional[DOMElement]:
     :param element: A DOM element
     :return:        The parent element of that DOM element, or None of none exists
     """
-    return dom(element).parent
+    return element.__json_dom_parent__
 
 
 def key(element: DOMElement) -> Optional[str]:
@@ -44,7 +46,7 @@ def key(element: DOMElement) -> Optional[str]:
     :param element: A DOM element
     :return:        The key of that DOM element in its parent, or None if it has no key
     """
-    return dom(element).element_key
+    return element.__json_dom_element_key__
 
 
 def schema(element: DOMElement) -> Schema:
@@ -57,3 +59,82 @@ def schema(element: DOMElement) -> Schema:
                     with that DOM element
     """
     return element.__json_schema__()
+
+
+def path_of(element: DOMElement) -> str:
+    """
+    Retrieve the JSON pointer (see RFC 6901) of a :class:`.DOMElement` in its owning
+    document, e.g. "/pets/3". Unlike :func:`key`, this also works for the items of lists.
+
+    The first call for a document builds an index of the pointers of all of its elements,
+    which is kept up to date when the document is changed, so that later calls take
+    constant time.
+
+    :param element: A DOM element
+    :return:        The JSON pointer of that DOM element in its owning document
+    """
+    return DOMPathIndex.for_document(document(element)).path_of(element)
+
+
+def resolve(element: DOMElement, pointer: str) -> Any:
+    """
+    Retrieve the value that a JSON pointer (see RFC 6901), such as "/pets/3/name",
+    refers to. The pointer is relative to `element`, so for a whole document,
+    pass the document itself. Uses the same index as :func:`path_of`.
+
+    :param element: A DOM element
+    :param pointer: A JSON pointer, relative to `element`
+    :return:        The DOM element or primitive value that `pointer` refers to
+    :raises KeyError: If no value exists for `pointer`
+    """
+    document_element = document(element)
+    path_index = DOMPathIndex.for_document(document_element)
+    if element is not document_element:
+        pointer = path_index.path_of(element) + pointer
+    return path_index.resolve(pointer)
+
+
+def get_many(element: DOMElement, pointers: Iterable[str]) -> List[Any]:
+    """
+    Retrieve the values that several JSON pointers refer to. See :func:`resolve`.
+
+    :param element:  A DOM element
+    :param pointers: JSON pointers, relative to `element`
+    :return:         A list of the values that `pointers` refer to, in the same order
+    :raises KeyError: If no value exists for any of `pointers`
+    """
+    document_element = document(element)
+    path_index = DOMPathIndex.for_document(document_element)
+    resolve_pointer = path_index.resolve
+    if element is document_element:
+        return [resolve_pointer(pointer) for pointer in pointers]
+    prefix = path_index.path_of(element)
+    return [resolve_pointer(prefix + pointer) for pointer in pointers]
+
+
+def instances_of(element: DOMElement, cls: Union[Type, str]) -> List[DOMElement]:
+    """
+    Retrieve all of the DOM elements within a :class:`.DOMElement` which are instances
+    of a class, such as a subclass of :class:`~wysdom.UserObject`, including instances
+    of its subclasses. Uses the same index as :func:`path_of`, so that once the index
+    has been built, the time taken is proportional to the number of elements found.
+
+    :param element: A DOM element
+    :param cls:     A class, or the registered name of a subclass of
+                    :class:`~wysdom.mixins.RegistersSubclasses`
+    :return:        A list of the matching elements within `element`, including
+                    `element` itself if it matches, in no particular order
+    """
+    document_element = document(element)
+    path_index = DOMPathIndex.for_document(document_element)
+    instances = path_index.instances_of(cls)
+    if element is document_element:
+        return instances
+    prefix = path_index.path_of(element)
+    descendant_prefix = prefix + "/"
+    descendants = []
+    for instance in instances:
+        pointer = path_index.path_of(instance)
+        if pointer == prefix or pointer.startswith(descendant_prefix):
+            descendants.append(instance)
+    return descendants
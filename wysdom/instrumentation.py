@@ -0,0 +1,146 @@
+from typing import Callable, Dict, List, NamedTuple
+
+import os
+
+# Set the WYSDOM_INSTRUMENTATION environment variable to record statistics
+# from the start of the process
+_enabled: bool = os.environ.get("WYSDOM_INSTRUMENTATION", "") not in ("", "0")
+
+Hook = Callable[[str, str, float], None]
+
+
+class Statistics(NamedTuple):
+    """
+    Named tuple containing the statistics recorded for one metric and key.
+
+    :param count: The number of events recorded.
+    :param total: The sum of the values of those events, e.g. the total time
+                  in seconds for a timed metric.
+    """
+
+    count: int
+    total: float
+
+
+# Recorded statistics, stored as [count, total] and indexed by metric and key
+_statistics: Dict[str, Dict[str, List[float]]] = {}
+_hooks: List[Hook] = []
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Set whether statistics about the work done by wysdom are recorded. Recording
+    is off by default, in which case it adds only a flag check to the code that
+    would record them.
+
+    The following metrics are recorded, each for a number of keys:
+
+    ================  ===================================  ==============================
+    Metric            Key                                  Value of each event
+    ================  ===================================  ==============================
+    validate          Schema reference name or class name  Time taken, in seconds
+    construct         DOM element class                    1
+    anyof_dispatch    Schema reference name or class name  Number of schemas tried
+    pattern_match     Regex pattern                        1 if the value matched, else 0
+    default           UserObject class and property name   Time taken, in seconds
+    cache_hit         Name of cache                        Number of values found
+    cache_miss        Name of cache                        Number of values not found
+    ================  ===================================  ==============================
+
+    The caches are the cached definitions and validators of schemas (whose names
+    start with "schema_") and the cached JSON of DOM elements ("json"), for which
+    one event is recorded for each call of `to_json` with `cache=True`.
+
+    :param enabled: If True, statistics are recorded and hooks are called.
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """
+    Determine whether statistics are currently being recorded.
+
+    :return: True if statistics are being recorded
+    """
+    return _enabled
+
+
+def record(metric: str, key: str, value: float = 1.0) -> None:
+    """
+    Record an event for a metric, and pass it to all of the registered hooks.
+    Callers should check that instrumentation is enabled first.
+
+    :param metric: The name of the metric, e.g. "validate"
+    :param key:    What the event applies to, e.g. the name of a schema
+    :param value:  The value of the event, e.g. the time taken in seconds
+    """
+    metric_statistics = _statistics.get(metric)
+    if metric_statistics is None:
+        metric_statistics = _statistics[metric] = {}
+    counts = metric_statistics.get(key)
+    if counts is None:
+        metric_statistics[key] = [1, value]
+    else:
+        counts[0] += 1
+        counts[1] += value
+    for hook in _hooks:
+        hook(metric, key, value)
+
+
+def statistics() -> Dict[str, Dict[str, Statistics]]:
+    """
+    Return a snapshot of the statistics recorded since instrumentation was enabled
+    or the statistics were last reset. See :func:`set_enabled`.
+
+    :return: A dict of :class:`Statistics`, keyed by metric and then by key
+    """
+    return {
+        metric: {
+            key: Statistics(count=count, total=total)
+            for key, (count, total) in metric_statistics.items()
+        }
+        for metric, metric_statistics in _statistics.items()
+    }
+
+
+def reset_statistics() -> None:
+    """
+    Discard the statistics returned by :func:`statistics`.
+    """
+    _statistics.clear()
+
+
+def add_hook(hook: Hook) -> None:
+    """
+    Register a function to be called with the metric, key and value of every event
+    recorded while instrumentation is enabled, e.g. to export it to a metrics system.
+    Hooks are called synchronously, so they should be fast.
+
+    :param hook: A function taking the metric name, key and value of an event
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    """
+    Unregister a function registered with :func:`add_hook`.
+
+    :param hook: The function to unregister
+    """
+    _hooks.remove(hook)
+
+
+def schema_key(schema: object) -> str:
+    """
+    Return the key used to record events for a schema: its reference name, or the
+    name of its class if it has none.
+    """
+    return getattr(schema, "schema_ref_name", None) or type(schema).__name__
+
+
+def class_key(cls: type) -> str:
+    """
+    Return the key used to record events for a class.
+    """
+    return f"{cls.__module__}.{cls.__name__}"
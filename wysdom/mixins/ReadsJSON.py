@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+from typing import Any, Iterator, TextIO
+from enum import Enum
+
 import json
+import re
+
+from .. import instrumentation
+from ..dom import DOMObject, DOMElement
+from ..dom.DOMElement import _BuildInfo, _LazyData
+from ..dom.DOMElement import element_data
 
-from ..dom import DOMObject
+_NON_WHITESPACE = re.compile(r"\S")
+_AFTER_ITEM = frozenset(" \t\n\r,]")
 
 
 class ReadsJSON(DOMObject):
@@ -10,31 +20,331 @@ class ReadsJSON(DOMObject):
     Adds JSON reading and writing functionality to a DOMObject.
     """
 
-    def to_json(self) -> str:
+    __slots__ = ()
+
+    def to_json(self, cache: bool = False) -> str:
         """
         Serialize the DOM object to JSON.
 
-        return: The DOM object, serialized as a JSON string
+        :param cache: If True, cache the JSON of each element of the DOM object, so that
+                      later calls only need to encode the elements that have changed
+                      since. This is useful for large documents that are serialized
+                      repeatedly, but the cached JSON uses additional memory. Elements
+                      that contain raw dicts or lists (e.g. the values of properties
+                      whose schema is :class:`~wysdom.SchemaAnything`) are not cached,
+                      as those can be changed without the DOM being notified.
+        :return:      The DOM object, serialized as a JSON string
+        """
+        if cache:
+            return _encode_with_cache(self)
+        return _encode(self)
+
+    def write_json(self, stream: TextIO, cache: bool = False) -> None:
+        """
+        Serialize the DOM object to JSON, writing it to a text stream piece by piece,
+        so that no complete copy of the data or of the JSON output is held in memory.
+        The output is the same as that of :meth:`to_json`.
+
+        :param stream: A writable text stream, such as a file opened in text mode
+        :param cache:  If True, write the JSON cached by :meth:`to_json` for any
+                       elements that have not changed since, instead of encoding them
+                       again. No new JSON is cached.
+        """
+        write = stream.write
+        for chunk in _iter_json_chunks(self, cache):
+            write(chunk)
+
+    def to_json_file(self, filename: str) -> None:
         """
-        return json.JSONEncoder().encode(self.to_builtin())
+        Serialize the DOM object to a JSON file on disk. See :meth:`write_json`.
+
+        :param filename: File path on disk of JSON file to write
+        """
+        with open(filename, "w") as json_file:
+            self.write_json(json_file)
 
     @classmethod
-    def from_json(cls, json_string: str) -> ReadsJSON:
+    def from_json(cls, json_string: str, lazy: bool = False) -> ReadsJSON:
         """
         Create a new DOM object by from a JSON string.
 
         :param json_string: JSON string to read
+        :param lazy:        If True, only create child elements when they are first accessed
         :return:            New DOM object instance
         """
-        return cls(json.JSONDecoder().decode(json_string))
+        return cls(
+            json.JSONDecoder().decode(json_string), _BuildInfo(lazy=lazy, owned=True)
+        )
 
     @classmethod
-    def from_json_file(cls, filename: str) -> ReadsJSON:
+    def from_json_file(cls, filename: str, lazy: bool = False) -> ReadsJSON:
         """
         Create a new DOM object from a file on disk.
 
         :param filename: File path on disk of JSON file
+        :param lazy:     If True, only create child elements when they are first accessed
         :return:         New DOM object instance
         """
         with open(filename) as json_file:
-            return cls(json.load(json_file))
+            return cls(json.load(json_file), _BuildInfo(lazy=lazy, owned=True))
+
+    @classmethod
+    def iter_json_file(
+        cls, filename: str, lazy: bool = False, chunk_size: int = 65536
+    ) -> Iterator[ReadsJSON]:
+        """
+        Create new DOM objects from the items of a JSON array in a file on disk.
+        The file is read incrementally, so only one item is held in memory at a time.
+
+        :param filename:   File path on disk of JSON file containing a top-level array
+        :param lazy:       If True, only create child elements when they are first accessed
+        :param chunk_size: Number of characters to read from the file at a time
+        :return:           An iterator of new DOM object instances
+        """
+        with open(filename) as json_file:
+            for item in _iter_json_array_items(json_file, chunk_size):
+                yield cls(item, _BuildInfo(lazy=lazy, owned=True))
+
+    @classmethod
+    def iter_jsonl_file(cls, filename: str, lazy: bool = False) -> Iterator[ReadsJSON]:
+        """
+        Create new DOM objects from the lines of a JSON Lines file on disk.
+        The file is read one line at a time. Blank lines are ignored.
+
+        :param filename: File path on disk of JSON Lines file
+        :param lazy:     If True, only create child elements when they are first accessed
+        :return:         An iterator of new DOM object instances
+        """
+        decoder = json.JSONDecoder()
+        with open(filename) as jsonl_file:
+            for line in jsonl_file:
+                if line.strip():
+                    yield cls(decoder.decode(line), _BuildInfo(lazy=lazy, owned=True))
+
+
+def _iter_json_array_items(stream: TextIO, chunk_size: int) -> Iterator[Any]:
+    """
+    Decode the items of a top-level JSON array from a text stream one at a time,
+    reading the stream in chunks.
+
+    :raises json.JSONDecodeError: If the stream does not contain a valid JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    at_end_of_stream = False
+
+    def read_more() -> None:
+        nonlocal buffer, position, at_end_of_stream
+        # Read at least as much as is already buffered, so that large items
+        # are not decoded from scratch too many times
+        chunk = stream.read(max(chunk_size, len(buffer) - position))
+        at_end_of_stream = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    def next_token() -> str:
+        nonlocal position
+        while True:
+            match = _NON_WHITESPACE.search(buffer, position)
+            if match:
+                position = match.start()
+                return buffer[position]
+            if at_end_of_stream:
+                position = len(buffer)
+                return ""
+            read_more()
+
+    if next_token() != "[":
+        raise json.JSONDecodeError("Expecting '['", buffer, position)
+    position += 1
+    if next_token() == "]":
+        position += 1
+    else:
+        while True:
+            next_token()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_end_of_stream:
+                        raise
+                    read_more()
+                    continue
+                # A value that is not followed by whitespace or a delimiter may be
+                # incomplete (e.g. a number that continues in the next chunk)
+                if not at_end_of_stream and (
+                    end == len(buffer) or buffer[end] not in _AFTER_ITEM
+                ):
+                    read_more()
+                    continue
+                break
+            position = end
+            yield item
+            delimiter = next_token()
+            position += 1
+            if delimiter == "]":
+                break
+            if delimiter != ",":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", buffer, position - 1
+                )
+    if next_token() != "":
+        raise json.JSONDecodeError("Extra data", buffer, position)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (DOMElement, Enum, _LazyData)):
+        return element_data(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Encodes DOM elements directly, by passing the encoder their underlying data
+# instead of first making a complete copy of it with to_builtin
+_ENCODER = json.JSONEncoder(default=_json_default)
+
+_END = object()
+
+
+def _encode(value: Any) -> str:
+    """
+    Encode a value as JSON with the standard encoder, which is fastest, falling
+    back to the iterative encoder of :func:`_iter_json_chunks` if the value is
+    nested too deeply for the standard encoder's recursion.
+    """
+    try:
+        return _ENCODER.encode(value)
+    except RecursionError:
+        return "".join(_iter_json_chunks(value))
+
+
+def _iter_json_chunks(value: Any, use_cache: bool = False) -> Iterator[str]:
+    """
+    Encode a DOM element as JSON, yielding the output in small pieces. The DOM
+    is traversed iteratively, so that there is no limit on the depth of the data.
+    If `use_cache` is True, the cached JSON of elements is used where it exists.
+    """
+    encode = _ENCODER.encode
+    # Iterators over the items of the containers currently being encoded,
+    # along with a flag that is True for dicts and False for lists
+    stack = []
+    while True:
+        cached = (
+            value.__json_cache__
+            if use_cache and isinstance(value, DOMElement)
+            else None
+        )
+        if cached is not None:
+            yield cached
+            first_item = False
+        else:
+            value = element_data(value)
+            if type(value) is dict:
+                yield "{"
+                stack.append((iter(value.items()), True))
+                first_item = True
+            elif type(value) is list:
+                yield "["
+                stack.append((iter(value), False))
+                first_item = True
+            else:
+                yield encode(value)
+                first_item = False
+        # Find the next value to encode, closing any containers that are finished
+        while stack:
+            items, is_dict = stack[-1]
+            item = next(items, _END)
+            if item is _END:
+                stack.pop()
+                yield "}" if is_dict else "]"
+                first_item = False
+                continue
+            separator = "" if first_item else ", "
+            if is_dict:
+                key, value = item
+                yield f"{separator}{encode(key)}: "
+            else:
+                value = item
+                if separator:
+                    yield separator
+            break
+        else:
+            return
+
+
+def _encode_with_cache(value: Any) -> str:
+    """
+    Encode a DOM element as JSON, reusing the cached JSON of any elements that have
+    not changed since they were last encoded, and caching the JSON of all other
+    elements. The DOM is traversed iteratively, so that there is no limit on the
+    depth of the data.
+
+    The JSON of elements containing raw dicts or lists, or child elements whose
+    parent is another element, is not cached, nor is that of their ancestors,
+    since changes to those children do not clear the cache.
+    """
+    encode = _ENCODER.encode
+    result = []
+    # Frames for the DOM elements currently being encoded, each containing the
+    # element, an iterator over its items, a flag that is True for dicts and False
+    # for lists, the encoded items so far, the list to append the finished element's
+    # JSON to, the key prefix to add to it, and a flag that is True if the
+    # element's JSON can be cached
+    stack = []
+    output = result
+    prefix = ""
+    # Numbers of elements whose JSON was and was not cached, for instrumentation
+    cache_hits = 0
+    cache_misses = 0
+    while True:
+        data = None
+        if isinstance(value, DOMElement):
+            if stack and value.__json_dom_parent__ is not stack[-1][0]:
+                # The element is shared with another element, such as the original
+                # of a shallow copy, and changes to it will only clear the cached
+                # JSON of the other element and its ancestors
+                stack[-1][6] = False
+            cached = value.__json_cache__
+            if cached is not None:
+                output.append(prefix + cached)
+                cache_hits += 1
+            else:
+                data = getattr(value, "__json_element_data__", None)
+                if data is None:
+                    output.append(prefix + _encode(value))
+        else:
+            output.append(prefix + _encode(value))
+            if stack and DOMElement._is_raw_container(value):
+                stack[-1][6] = False
+        if data is not None:
+            is_dict = type(data) is dict
+            items = iter(data.items()) if is_dict else iter(data)
+            stack.append([value, items, is_dict, [], output, prefix, True])
+        # Find the next value to encode, finishing any elements that are complete
+        while stack:
+            frame = stack[-1]
+            element, items, is_dict, parts, element_output, element_prefix = frame[:6]
+            item = next(items, _END)
+            if item is _END:
+                stack.pop()
+                element_json = ("{%s}" if is_dict else "[%s]") % ", ".join(parts)
+                if frame[6]:
+                    element.__json_cache__ = element_json
+                elif stack:
+                    stack[-1][6] = False
+                element_output.append(element_prefix + element_json)
+                cache_misses += 1
+                continue
+            output = parts
+            if is_dict:
+                key, value = item
+                prefix = f"{encode(key)}: "
+            else:
+                value = item
+                prefix = ""
+            break
+        else:
+            if instrumentation._enabled:
+                instrumentation.record("cache_hit", "json", cache_hits)
+                instrumentation.record("cache_miss", "json", cache_misses)
+            return result[0]
@@ -1,10 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Union, TextIO
+from typing import Any, Iterator, Union, TextIO
+from enum import Enum
 
 import yaml
 
-from ..dom import DOMObject
+from ..dom import DOMObject, DOMElement
+from ..dom.DOMElement import _BuildInfo, _LazyData
+from ..dom.DOMElement import element_data
+
+# Use the libyaml-backed loader and dumper if PyYAML was built with libyaml,
+# falling back to the pure Python implementations otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader, SafeDumper
+
+
+class DOMDumper(SafeDumper):
+    """
+    A YAML dumper that can serialize DOM elements directly, without first making
+    a copy of their data with `to_builtin`.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        # Write the same output as for a copy of the data made with to_builtin,
+        # which never contains aliases
+        return True
+
+
+def _represent_dom_element(dumper: DOMDumper, value: DOMElement) -> yaml.Node:
+    return dumper.represent_data(element_data(value))
+
+
+DOMDumper.add_multi_representer(DOMElement, _represent_dom_element)
+DOMDumper.add_multi_representer(Enum, _represent_dom_element)
+DOMDumper.add_representer(_LazyData, _represent_dom_element)
 
 
 class ReadsYAML(DOMObject):
@@ -12,6 +43,8 @@ class ReadsYAML(DOMObject):
     Adds YAML reading and writing functionality to a DOMObject.
     """
 
+    __slots__ = ()
+
     def to_yaml(self, **kwargs: Any) -> str:
         """
         Serialize the DOM object to YAML.
@@ -20,25 +53,90 @@ class ReadsYAML(DOMObject):
                        See parameters for Dumper in https://pyyaml.org/wiki/PyYAMLDocumentation
         :return:       The DOM object, serialized as a YAML string
         """
-        return yaml.safe_dump(self.to_builtin(), **kwargs)
+        return yaml.dump(self, Dumper=DOMDumper, **kwargs)
+
+    def write_yaml(self, stream: TextIO, **kwargs: Any) -> None:
+        """
+        Serialize the DOM object to YAML, writing it to a text stream, without first
+        making a copy of the data with `to_builtin`.
+
+        :param stream: A writable text stream, such as a file opened in text mode
+        :param kwargs: Optional keyword arguments to pass to PyYAML's safe_dump method.
+                       See parameters for Dumper in https://pyyaml.org/wiki/PyYAMLDocumentation
+        """
+        yaml.dump(self, stream, Dumper=DOMDumper, **kwargs)
+
+    def to_yaml_file(self, filename: str, **kwargs: Any) -> None:
+        """
+        Serialize the DOM object to a YAML file on disk. See :meth:`write_yaml`.
+
+        :param filename: File path on disk of YAML file to write
+        :param kwargs:   Optional keyword arguments to pass to PyYAML's safe_dump method.
+        """
+        with open(filename, "w") as stream:
+            self.write_yaml(stream, **kwargs)
 
     @classmethod
-    def from_yaml(cls, yaml_string: Union[str, TextIO]) -> ReadsYAML:
+    def from_yaml(
+        cls, yaml_string: Union[str, TextIO], lazy: bool = False
+    ) -> ReadsYAML:
         """
         Create a new DOM object by from a YAML string.
 
         :param yaml_string: YAML string to read
+        :param lazy:        If True, only create child elements when they are first accessed
         :return:            New DOM object instance
         """
-        return cls(yaml.safe_load(yaml_string))
+        return cls(
+            yaml.load(_yaml_input(yaml_string), Loader=SafeLoader),
+            _BuildInfo(lazy=lazy, owned=True),
+        )
 
     @classmethod
-    def from_yaml_file(cls, filename: str) -> ReadsYAML:
+    def from_yaml_file(cls, filename: str, lazy: bool = False) -> ReadsYAML:
         """
         Create a new DOM object from a file on disk.
 
         :param filename: File path on disk of YAML file
+        :param lazy:     If True, only create child elements when they are first accessed
         :return:         New DOM object instance
         """
         with open(filename, "r") as stream:
-            return cls.from_yaml(stream)
+            return cls.from_yaml(stream, lazy=lazy)
+
+    @classmethod
+    def iter_yaml(
+        cls, yaml_string: Union[str, TextIO], lazy: bool = False
+    ) -> Iterator[ReadsYAML]:
+        """
+        Create new DOM objects from each document in a multi-document YAML
+        string or stream. Documents are parsed one at a time as the iterator
+        is consumed. Empty documents are skipped.
+
+        :param yaml_string: YAML string or stream to read
+        :param lazy:        If True, only create child elements when they are first accessed
+        :return:            An iterator of new DOM object instances
+        """
+        for document in yaml.load_all(_yaml_input(yaml_string), Loader=SafeLoader):
+            if document is not None:
+                yield cls(document, _BuildInfo(lazy=lazy, owned=True))
+
+    @classmethod
+    def iter_yaml_file(cls, filename: str, lazy: bool = False) -> Iterator[ReadsYAML]:
+        """
+        Create new DOM objects from each document in a multi-document YAML
+        file on disk. The file is read incrementally.
+
+        :param filename: File path on disk of YAML file
+        :param lazy:     If True, only create child elements when they are first accessed
+        :return:         An iterator of new DOM object instances
+        """
+        with open(filename, "r") as stream:
+            yield from cls.iter_yaml(stream, lazy=lazy)
+
+
+def _yaml_input(yaml_string: Union[str, TextIO]) -> Union[str, TextIO]:
+    # The libyaml parser only accepts exact str instances, not subclasses of str
+    if isinstance(yaml_string, str):
+        return str(yaml_string)
+    return yaml_string
@@ -12,8 +12,11 @@ class RegistersSubclasses(ABC):
     parameter in the subclass declaration.
     """
 
+    __slots__ = ()
+
     registered_name = None
     __registered_subclasses__: Optional[Dict[str, RegisteredSubclassList]] = None
+    __registration_version__: int = 0
 
     def __init_subclass__(
         cls, register_as: Optional[str] = None, **kwargs: Any
@@ -36,6 +39,7 @@ class RegistersSubclasses(ABC):
         if cls not in cls.__registered_subclasses__[name]:
             cls.__registered_subclasses__[name].append(cls)
         cls.registered_name = name
+        RegistersSubclasses.__registration_version__ += 1
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -48,11 +52,34 @@ class RegistersSubclasses(ABC):
         :return: A dictionary of subclasses, indexed by registered name.
         """
         return {
-            name: cls.registered_subclasses_by_name(name)
-            for name in cls.__registered_subclasses__.keys()
-            if len(cls.registered_subclasses_by_name(name)) > 0
+            name: list(subclasses)
+            for name, subclasses in cls._registered_subclasses_map().items()
         }
 
+    @classmethod
+    def _registered_subclasses_map(cls) -> Dict[str, RegisteredSubclassList]:
+        """
+        Return the registered subclasses in this class's namespace, cached until
+        another subclass of :class:`RegistersSubclasses` is declared.
+        """
+        cached_map = cls.__dict__.get("__registered_subclasses_map__")
+        if (
+            cached_map is None
+            or cached_map[0] != RegistersSubclasses.__registration_version__
+        ):
+            subclasses_map = {}
+            for name, subclasses in cls.__registered_subclasses__.items():
+                proper_subclasses = [
+                    subclass
+                    for subclass in subclasses
+                    if issubclass(subclass, cls) and subclass is not cls
+                ]
+                if proper_subclasses:
+                    subclasses_map[name] = proper_subclasses
+            cached_map = (RegistersSubclasses.__registration_version__, subclasses_map)
+            cls.__registered_subclasses_map__ = cached_map
+        return cached_map[1]
+
     @classmethod
     def registered_subclasses_by_name(cls, name) -> RegisteredSubclassList:
         """
@@ -63,11 +90,7 @@ class RegistersSubclasses(ABC):
                      `register_as` when the class was declared.
         :return:     A list of subclasses of the class from which this method was called.
         """
-        return [
-            subclass
-            for subclass in cls.__registered_subclasses__.get(name, [])
-            if issubclass(subclass, cls) and subclass is not cls
-        ]
+        return list(cls._registered_subclasses_map().get(name, []))
 
     @classmethod
     def registered_subclass(
@@ -128,6 +151,6 @@ def has_registered_subclasses(cls: type) -> bool:
     """
     has_subclasses = False
     if issubclass(cls, RegistersSubclasses):
-        if cls.registered_subclasses():
+        if cls._registered_subclasses_map():
             has_subclasses = True
     return has_subclasses
@@ -1,14 +1,24 @@
 from typing import Any, Dict, Tuple, Iterable, Optional
 
+from .. import instrumentation
 from ..dom import DOMInfo
+from ..dom.DOMElement import _BuildInfo
 from ..exceptions import ValidationError
 from ..base_schema import Schema
+from ..trust import is_trusted
 
 
 class SchemaAnyOf(Schema):
     """
     A schema requiring a match with any of the permitted schemas supplied.
 
+    If every permitted schema binds the same property to a different string
+    constant (e.g. with :class:`~wysdom.SchemaConst`), that property is used as a
+    discriminator: values are dispatched directly to the schema matching the
+    property's value, instead of being validated against every permitted schema.
+    Values that have already been validated, or that are trusted (see
+    :func:`wysdom.trusted`), are dispatched without being validated at all.
+
     :param allowed_schemas: A list (or other Iterable) containing the permitted
                             `Schema` objects.
     :param schema_ref_name: An optional unique reference name to use when this schema
@@ -25,11 +35,43 @@ class SchemaAnyOf(Schema):
         self.schema_ref_name = schema_ref_name
 
     def __call__(self, value: Any, dom_info: DOMInfo = None) -> Any:
-        valid_schemas = [
-            allowed_schema
-            for allowed_schema in self.allowed_schemas
-            if allowed_schema.is_valid(value)
-        ]
+        matching_schema = None
+        if getattr(dom_info, "validated", False) or is_trusted():
+            # A valid value can only match the schema that its discriminator selects
+            matching_schema = self._discriminated_schema(value)
+            if matching_schema is not None and instrumentation._enabled:
+                instrumentation.record(
+                    "anyof_dispatch", instrumentation.schema_key(self), 0
+                )
+        if matching_schema is None:
+            matching_schema = self._matching_schema(value)
+        return matching_schema(
+            value, _BuildInfo(*(dom_info or ()))._replace(validated=True)
+        )
+
+    def _matching_schema(self, value: Any) -> Schema:
+        """
+        Return the only permitted schema that `value` is valid for.
+
+        :raises ValidationError: If no permitted schema, or more than one, is valid.
+        """
+        discriminated_schema = self._discriminated_schema(value)
+        if discriminated_schema is not None and discriminated_schema.is_valid(value):
+            valid_schemas = [discriminated_schema]
+            schemas_tried = 1
+        else:
+            valid_schemas = [
+                allowed_schema
+                for allowed_schema in self.allowed_schemas
+                if allowed_schema.is_valid(value)
+            ]
+            schemas_tried = len(self.allowed_schemas) + (
+                discriminated_schema is not None
+            )
+        if instrumentation._enabled:
+            instrumentation.record(
+                "anyof_dispatch", instrumentation.schema_key(self), schemas_tried
+            )
         if len(valid_schemas) > 1:
             raise ValidationError(
                 "Ambiguous validation, more than one schema "
@@ -39,10 +81,66 @@ class SchemaAnyOf(Schema):
             raise ValidationError(
                 f"No valid schema was found for the supplied value: {value}"
             )
-        return valid_schemas[0](value, dom_info)
+        return valid_schemas[0]
+
+    def _validate_nested(self, value: Any) -> None:
+        self._matching_schema(value)._validate_nested(value)
+
+    def is_valid(self, value: Any) -> bool:
+        discriminated_schema = self._discriminated_schema(value)
+        if discriminated_schema is not None:
+            return discriminated_schema.is_valid(value)
+        return any(
+            allowed_schema.is_valid(value) for allowed_schema in self.allowed_schemas
+        )
+
+    @property
+    def discriminator(self) -> Optional[str]:
+        """
+        The name of the property used to dispatch values to one of the permitted
+        schemas, or None if no such property exists.
+        """
+        return self._dispatch_table()[0]
+
+    def _discriminated_schema(self, value: Any) -> Optional[Schema]:
+        """
+        Return the only permitted schema that `value` could be valid for, according to
+        its discriminator property, or None if the discriminator cannot be used.
+        """
+        discriminator, schemas_by_value = self._dispatch_table()
+        if discriminator is None or not isinstance(value, dict):
+            return None
+        discriminator_value = value.get(discriminator)
+        if isinstance(discriminator_value, str):
+            return schemas_by_value.get(discriminator_value)
+        return None
+
+    def _dispatch_table(self) -> Tuple[Optional[str], Dict[str, Schema]]:
+        return self._cached("_cached_dispatch_table", self._build_dispatch_table)
+
+    def _build_dispatch_table(self) -> Tuple[Optional[str], Dict[str, Schema]]:
+        all_const_properties = [
+            allowed_schema.const_properties for allowed_schema in self.allowed_schemas
+        ]
+        if not all_const_properties:
+            return None, {}
+        for name in sorted(set.intersection(*map(set, all_const_properties))):
+            const_values = [
+                const_properties[name] for const_properties in all_const_properties
+            ]
+            if all(isinstance(v, str) for v in const_values) and len(
+                set(const_values)
+            ) == len(const_values):
+                return name, dict(zip(const_values, self.allowed_schemas))
+        return None, {}
 
     @property
     def referenced_schemas(self) -> Dict[str, Schema]:
+        return self._cached(
+            "_cached_referenced_schemas", self._build_referenced_schemas
+        )
+
+    def _build_referenced_schemas(self) -> Dict[str, Schema]:
         referenced_schemas = {}
         for allowed_schema in self.allowed_schemas:
             referenced_schemas.update(allowed_schema.referenced_schemas)
@@ -52,6 +150,9 @@ class SchemaAnyOf(Schema):
 
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
+        return self._cached("_cached_definition", self._build_definition)
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             "anyOf": [
                 allowed_schema.jsonschema_ref_schema
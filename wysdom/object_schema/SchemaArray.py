@@ -2,6 +2,7 @@ from typing import Any, Union, Type, Dict, Iterable
 
 from ..dom import DOMInfo, DOMList
 from ..base_schema import Schema
+from ..exceptions import ValidationError
 
 from .resolve_arg_to_type import resolve_arg_to_schema
 
@@ -25,6 +26,26 @@ class SchemaArray(Schema):
     def __call__(self, value: Iterable, dom_info: DOMInfo = None) -> Any:
         return DOMList(value, dom_info, item_type=self.items)
 
+    def is_valid(self, value: Any) -> bool:
+        # The "array" keyword in jsonschema_definition is not a JSON Schema keyword,
+        # so jsonschema accepts any value here. Items are validated individually
+        # when the DOMList is created.
+        return True
+
+    def _validate_nested(self, value: Any) -> None:
+        if value and not isinstance(value, Iterable):
+            raise ValidationError(
+                f"Cannot validate input. Object is not iterable: {value}"
+            )
+        for item in value or ():
+            if not self.items.is_valid(item):
+                # Accept or reject the item just as creating it eagerly would: some
+                # schemas convert values that they do not validate (e.g. "5" for an
+                # integer), and a SchemaAnyOf raises its own error if none matches
+                self.items(item)
+            else:
+                self.items._validate_nested(item)
+
     @property
     def referenced_schemas(self) -> Dict[str, Schema]:
         return self.items.referenced_schemas
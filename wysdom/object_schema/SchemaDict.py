@@ -31,4 +31,9 @@ class SchemaDict(SchemaObject):
         )
 
     def __call__(self, value: Any, dom_info: DOMInfo = None) -> Any:
-        return DOMDict(value, dom_info, item_type=self.additional_properties)
+        return DOMDict(
+            value,
+            dom_info,
+            item_type=self.additional_properties,
+            property_names=self.property_names,
+        )
@@ -1,8 +1,9 @@
-from typing import Optional, Dict, Type, Any, Union, Set
+from typing import Optional, Dict, Type, Any, Union, Set, Callable
 
 from ..dom import DOMInfo
-from ..base_schema import SchemaType
+from ..base_schema import SchemaType, SchemaConst, SchemaPrimitive
 from ..base_schema import Schema
+from ..base_schema.SchemaType import JSON_TYPE_CHECKS
 
 
 class SchemaObject(SchemaType):
@@ -44,12 +45,65 @@ class SchemaObject(SchemaType):
         self.object_type = object_type
         self.schema_ref_name = schema_ref_name
         self.property_names = property_names
+        self._property_checks = {
+            name: _is_valid_function(schema) for name, schema in self.properties.items()
+        }
+        # Only these properties need to be visited by _validate_nested
+        self._nested_properties = {
+            name: schema
+            for name, schema in self.properties.items()
+            if _has_nested_checks(schema)
+        }
 
     def __call__(self, value: Any, dom_info: DOMInfo = None) -> Any:
         return self.object_type(value, dom_info)
 
+    def is_valid(self, value: Any) -> bool:
+        if not isinstance(value, dict):
+            return False
+        if not self.required.issubset(value):
+            return False
+        property_checks = self._property_checks
+        additional_properties = self.additional_properties
+        property_names = self.property_names
+        for key, item in value.items():
+            property_check = property_checks.get(key)
+            if property_check is not None:
+                if not property_check(item):
+                    return False
+            elif isinstance(additional_properties, Schema):
+                if not additional_properties.is_valid(item):
+                    return False
+            elif not additional_properties:
+                return False
+            if property_names is not None and not property_names.is_valid(key):
+                return False
+        return True
+
+    def _validate_nested(self, value: Any) -> None:
+        for key, property_schema in self._nested_properties.items():
+            if key in value:
+                property_schema._validate_nested(value[key])
+        if _has_nested_checks(self.additional_properties):
+            for key, item in value.items():
+                if key not in self.properties:
+                    self.additional_properties._validate_nested(item)
+
+    @property
+    def const_properties(self) -> Dict[str, Any]:
+        return {
+            name: schema.value
+            for name, schema in self.properties.items()
+            if isinstance(schema, SchemaConst)
+        }
+
     @property
     def referenced_schemas(self) -> Dict[str, Schema]:
+        return self._cached(
+            "_cached_referenced_schemas", self._build_referenced_schemas
+        )
+
+    def _build_referenced_schemas(self) -> Dict[str, Schema]:
         referenced_schemas = {}
         if isinstance(self.additional_properties, Schema):
             referenced_schemas.update(self.additional_properties.referenced_schemas)
@@ -61,6 +115,9 @@ class SchemaObject(SchemaType):
 
     @property
     def jsonschema_definition(self) -> Dict[str, Any]:
+        return self._cached("_cached_definition", self._build_definition)
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             **super().jsonschema_definition,
             "properties": {
@@ -78,3 +135,24 @@ class SchemaObject(SchemaType):
                 else {}
             ),
         }
+
+
+def _is_valid_function(schema: Schema) -> Callable[[Any], bool]:
+    """
+    Return a function that validates a value against `schema`. The types of
+    primitive values are checked directly, without calling `schema.is_valid`.
+    """
+    if type(schema) is SchemaPrimitive and schema.python_type in schema.JSON_TYPES:
+        return JSON_TYPE_CHECKS[schema.type_name]
+    return schema.is_valid
+
+
+def _has_nested_checks(schema: Any) -> bool:
+    """
+    Determine whether `schema` makes any checks in `_validate_nested`, so that
+    properties whose schemas do not are skipped by `validate_deep`.
+    """
+    return (
+        isinstance(schema, Schema)
+        and type(schema)._validate_nested is not Schema._validate_nested
+    )
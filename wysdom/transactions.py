@@ -0,0 +1,95 @@
+from typing import Any, Iterator, TypeVar, Union
+
+from contextlib import contextmanager
+
+from .base_schema import Schema, SchemaAnything
+from .dom import DOMObject, DOMList, schema
+from .dom.DOMPathIndex import get_path_index
+from .object_schema import SchemaArray, SchemaObject
+from .trust import _batched_elements
+
+T = TypeVar("T", bound=Union[DOMObject, DOMList])
+
+
+@contextmanager
+def batch(element: T) -> Iterator[T]:
+    """
+    A context manager for making several changes to a DOM object or list, which
+    are validated together when the block exits, instead of one at a time as
+    they are made. This is faster when many changes are made. If the changes are
+    not valid, or an exception is raised within the block, all of the changes to
+    the element are undone::
+
+        with wysdom.batch(person_instance):
+            person_instance.first_name = "Homer"
+            person_instance.last_name = "Simpson"
+
+    Only the validation of scalar values (such as strings and numbers) set within
+    the element and its descendants, and of new dict keys, is deferred. Dicts and
+    lists assigned within the block are validated when they are assigned, as
+    creating the new elements converts the values within them. Other objects,
+    including new objects created within the block, are validated as usual.
+
+    :param element: A :class:`~wysdom.dom.DOMObject` (such as an instance of a
+                    :class:`~wysdom.UserObject`) or a :class:`~wysdom.dom.DOMList`.
+    :return:        The element itself.
+    :raises ValidationError: If the element is not valid when the block exits.
+    """
+    if not isinstance(element, (DOMObject, DOMList)):
+        raise TypeError(f"Only DOM objects and lists can be batched, not {element}")
+    original_value = element.to_builtin()
+    token = _batched_elements.set(_batched_elements.get() + (element,))
+    try:
+        try:
+            yield element
+        finally:
+            _batched_elements.reset(token)
+        _contents_schema(element).validate_deep(element.to_builtin())
+    except BaseException:
+        _restore(element, original_value)
+        raise
+
+
+def _contents_schema(element: Union[DOMObject, DOMList]) -> Schema:
+    """
+    Return a schema that the contents of a DOM object or list must be valid against.
+    """
+    element_schema = schema(element)
+    if not isinstance(element_schema, SchemaAnything):
+        return element_schema
+    if isinstance(element, DOMList):
+        return SchemaArray(getattr(element, "item_type", None) or SchemaAnything())
+    dom_properties = element.__json_schema_properties__
+    return SchemaObject(
+        properties=dom_properties.properties,
+        required=dom_properties.required,
+        additional_properties=dom_properties.additional_properties,
+        property_names=dom_properties.property_names,
+    )
+
+
+def _restore(element: Union[DOMObject, DOMList], value: Any) -> None:
+    """
+    Replace the contents of a DOM object or list with new child elements created
+    from `value`, which was previously returned by its `to_builtin` method.
+    """
+    element_data = element.__json_element_data__
+    if isinstance(element, DOMList):
+        old_children = list(element_data)
+        element_data[:] = [
+            element._new_child_item(item, validated=True) for item in value
+        ]
+        keys = range(len(element_data))
+    else:
+        old_children = list(element_data.values())
+        element_data.clear()
+        for key, item in value.items():
+            if item is None:
+                element_data[key] = None
+            else:
+                element._set_item(key, item, validated=True)
+        keys = list(element_data)
+    path_index = get_path_index(element)
+    if path_index is not None:
+        path_index.replace_children(element, old_children, keys)
+    element._element_changed()
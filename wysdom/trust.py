@@ -0,0 +1,74 @@
+from typing import Any, Iterator, Tuple
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_trusted: ContextVar[bool] = ContextVar("wysdom_trusted", default=False)
+
+# DOM elements that are being changed within a call of wysdom.batch. Changes to
+# them and to their descendants are validated when the batch ends instead.
+_batched_elements: ContextVar[Tuple[Any, ...]] = ContextVar(
+    "wysdom_batched_elements", default=()
+)
+
+# Set the WYSDOM_ALWAYS_VALIDATE environment variable (e.g. in debug builds)
+# to validate data even when it is created in trusted mode
+_always_validate: bool = os.environ.get("WYSDOM_ALWAYS_VALIDATE", "") not in ("", "0")
+
+
+@contextmanager
+def trusted() -> Iterator[None]:
+    """
+    A context manager within which data used to create or modify DOM objects is
+    trusted to be valid, and is not validated against its schema. Use this only
+    for data that is known to be valid, such as the output of `to_builtin` from
+    an object of the same class. Invalid data may lead to incorrect objects.
+
+    Validation can be turned back on globally, for example in debug builds, with
+    :func:`set_always_validate` or the `WYSDOM_ALWAYS_VALIDATE` environment variable.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def is_trusted() -> bool:
+    """
+    Determine whether validation should currently be skipped because the current
+    context is in trusted mode.
+
+    :return: True if validation should be skipped
+    """
+    return _trusted.get() and not _always_validate
+
+
+def set_always_validate(always_validate: bool) -> None:
+    """
+    Set whether data should always be validated, even in trusted mode.
+
+    :param always_validate: If True, :func:`trusted` has no effect.
+    """
+    global _always_validate
+    _always_validate = always_validate
+
+
+def in_batch(element: Any) -> bool:
+    """
+    Determine whether changes to a DOM element should not be validated as they are
+    made, because the element or one of its ancestors is being changed within a
+    call of :func:`wysdom.batch`.
+
+    :param element: The DOM element that is being changed
+    :return:        True if validation of the change should be skipped
+    """
+    batched_elements = _batched_elements.get()
+    if not batched_elements:
+        return False
+    while element is not None:
+        if any(element is batched for batched in batched_elements):
+            return True
+        element = element.__json_dom_parent__
+    return False
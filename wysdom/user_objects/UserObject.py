@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Type, Iterator, Union, Mapping, Dict
+from typing import (
+    Any,
+    Optional,
+    Type,
+    Iterator,
+    Iterable,
+    Union,
+    Mapping,
+    Dict,
+    List,
+    Tuple,
+)
 
-import inspect
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 
+import jsonschema
+
+from ..exceptions import ValidationError
 from ..mixins import RegistersSubclasses, has_registered_subclasses
 from ..base_schema import Schema
 from ..object_schema import SchemaObject, SchemaAnyOf
 from ..dom import DOMObject, DOMProperties, DOMInfo
+from ..dom.DOMElement import _BuildInfo
+from ..trust import trusted
 
 from .UserProperty import UserProperty
 
@@ -35,17 +53,16 @@ class UserProperties(DOMProperties):
         properties = {}
         required = set()
         for superclass in reversed(list(self._schema_superclasses())):
-            for k, v in superclass.__dict__.items():
-                if isinstance(v, UserProperty):
-                    if not v.name:
-                        v.name = k
-                    properties[v.name] = v.schema_type
-                    if not v.optional:
-                        required.add(v.name)
+            for k, v in superclass.__json_user_properties__.items():
+                if not v.name:
+                    v.name = k
+                properties[v.name] = v.schema_type
+                if not v.optional:
+                    required.add(v.name)
         super().__init__(properties, required, additional_properties)
 
     def _schema_superclasses(self) -> Iterator[Type[UserObject]]:
-        for superclass in inspect.getmro(self._user_class):
+        for superclass in self._user_class.__mro__:
             if issubclass(superclass, UserObject) and superclass is not UserObject:
                 yield superclass
 
@@ -59,7 +76,7 @@ class UserObjectSchema(Schema):
     The exact behavior (determined by UserObjectSchema.inner_schema) is
     determined dynamically to ensure that the schema will include any
     future registered subclasses that are defined after the UserObject's
-    creation.
+    creation. It is cached until the next subclass is registered.
 
     :param object_type:   The UserObject subclass.
     """
@@ -69,6 +86,19 @@ class UserObjectSchema(Schema):
 
     @property
     def inner_schema(self) -> Schema:
+        cached_inner_schema = getattr(self, "_cached_inner_schema", None)
+        if (
+            cached_inner_schema is None
+            or cached_inner_schema[0] != RegistersSubclasses.__registration_version__
+        ):
+            cached_inner_schema = (
+                RegistersSubclasses.__registration_version__,
+                self._build_inner_schema(),
+            )
+            self._cached_inner_schema = cached_inner_schema
+        return cached_inner_schema[1]
+
+    def _build_inner_schema(self) -> Schema:
         if has_registered_subclasses(self.object_type):
             assert issubclass(self.object_type, RegistersSubclasses)
             return SchemaAnyOf(
@@ -93,6 +123,16 @@ class UserObjectSchema(Schema):
     def __call__(self, value: Any, dom_info: DOMInfo = None) -> Any:
         return self.inner_schema.__call__(value, dom_info)
 
+    def is_valid(self, value: Any) -> bool:
+        return self.inner_schema.is_valid(value)
+
+    def _validate_nested(self, value: Any) -> None:
+        self.inner_schema._validate_nested(value)
+
+    @property
+    def const_properties(self) -> Dict[str, Any]:
+        return self.inner_schema.const_properties
+
     @property
     def referenced_schemas(self) -> Dict[str, Schema]:
         return self.inner_schema.referenced_schemas
@@ -126,7 +166,11 @@ class UserObject(DOMObject):
                           conjunction with `value`.
     """
 
+    __slots__ = ()
+
     __json_schema_properties__: UserProperties = None
+    __json_user_object_schema__: UserObjectSchema = None
+    __json_user_properties__: Dict[str, UserProperty] = {}
 
     def __init_subclass__(
         cls,
@@ -134,8 +178,18 @@ class UserObject(DOMObject):
         additional_properties: Union[bool, Schema] = False,
         **kwargs: Any,
     ) -> None:
+        cls.__json_user_properties__ = {
+            k: v for k, v in cls.__dict__.items() if isinstance(v, UserProperty)
+        }
         cls.__json_schema_properties__ = UserProperties(cls)
         super().__init_subclass__(*args, **kwargs)
+        cls.__json_user_object_schema__ = UserObjectSchema(cls)
+        if _uses_default_item_access(cls):
+            for k, v in cls.__json_user_properties__.items():
+                setattr(cls, k, v._build_accessor(cls))
+        else:
+            _restore_user_property_descriptors(cls)
+        Schema.invalidate_caches()
 
     def __init__(
         self,
@@ -144,7 +198,7 @@ class UserObject(DOMObject):
         **kwargs: Any,
     ) -> None:
         if json_dom_info:
-            if not isinstance(json_dom_info, DOMInfo):
+            if not isinstance(json_dom_info, (DOMInfo, _BuildInfo)):
                 raise TypeError(
                     "The name json_dom_info is a reserved parameter of "
                     "UserObject and must be of type "
@@ -154,4 +208,199 @@ class UserObject(DOMObject):
 
     @classmethod
     def __json_schema__(cls) -> Schema:
-        return UserObjectSchema(cls)
+        return cls.__json_user_object_schema__ or UserObjectSchema(cls)
+
+    @classmethod
+    def from_trusted(
+        cls, value: Mapping[str, Any] = None, lazy: bool = False, **kwargs: Any
+    ) -> UserObject:
+        """
+        Create a new object of this class from data that is already known to be
+        valid, such as the output of `to_builtin`, without validating it against
+        the schema. Parent, document and key information and enum conversion are
+        the same as for a validated object. See :func:`wysdom.trusted`.
+
+        :param value:  A dict-like object to populate the underlying data object's keys
+        :param lazy:   If True, only create child elements when they are first accessed
+        :param kwargs: Keyword arguments to populate the underlying data object's keys
+        :return:       A new object of this class
+        """
+        with trusted():
+            return cls(value, _BuildInfo(lazy=lazy), **kwargs)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        lazy: bool = False,
+        errors: Optional[List[Tuple[int, Exception]]] = None,
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[UserObject]:
+        """
+        Create a list of new objects of this class from an iterable of records.
+        The schema is resolved once for all records, and each record is validated
+        only once.
+
+        :param records:    An iterable of dict-like objects, one for each new object
+        :param lazy:       If True, only create child elements when they are first accessed
+        :param errors:     If a list is supplied, invalid records are skipped and an
+                           (index, exception) tuple is appended to it for each of them.
+                           Otherwise the first invalid record raises an exception.
+        :param processes:  If supplied, the records (including all of the elements
+                           within them) are validated in parallel by a pool of this
+                           many worker processes, and the new objects are then created
+                           without validating them again. The class and the records
+                           must then be picklable.
+        :param chunk_size: Number of records sent to a worker process at a time
+        :return:           A list of new objects, in the same order as the records
+        """
+        return list(
+            cls.iter_records(
+                records,
+                lazy=lazy,
+                errors=errors,
+                processes=processes,
+                chunk_size=chunk_size,
+            )
+        )
+
+    @classmethod
+    def iter_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        lazy: bool = False,
+        errors: Optional[List[Tuple[int, Exception]]] = None,
+        processes: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[UserObject]:
+        """
+        Create new objects of this class from an iterable of records, one at a time
+        as the returned iterator is consumed. See :meth:`from_records`.
+
+        :param records:    An iterable of dict-like objects, one for each new object
+        :param lazy:       If True, only create child elements when they are first accessed
+        :param errors:     If a list is supplied, invalid records are skipped and an
+                           (index, exception) tuple is appended to it for each of them.
+                           Otherwise the first invalid record raises an exception.
+        :param processes:  If supplied, the records (including all of the elements
+                           within them) are validated in parallel by a pool of this
+                           many worker processes, and the new objects are then created
+                           without validating them again. The class and the records
+                           must then be picklable.
+        :param chunk_size: Number of records sent to a worker process at a time
+        :return:           An iterator of new objects, in the same order as the records
+        """
+        if processes is None:
+            checked_records = _check_records(cls, records)
+        else:
+            checked_records = _check_records_in_processes(
+                cls, records, processes, chunk_size
+            )
+        json_dom_info = _BuildInfo(validated=True, lazy=lazy)
+        for index, (record, error) in enumerate(checked_records):
+            if error is None:
+                try:
+                    # The record has been validated deeply, so nothing within it
+                    # needs to be validated again as its child elements are created
+                    with trusted():
+                        new_object = cls(record, json_dom_info)
+                except (ValueError, jsonschema.ValidationError) as e:
+                    error = e
+                else:
+                    yield new_object
+                    continue
+            if errors is None:
+                raise error
+            errors.append((index, error))
+
+
+def _uses_default_item_access(user_class: Type[UserObject]) -> bool:
+    """
+    Determine whether a class reads and writes its properties using the methods of
+    :class:`~wysdom.dom.DOMObject`, so that the accessors built by
+    :class:`.UserProperty` can access its data directly.
+    """
+    return all(
+        getattr(user_class, method) is getattr(DOMObject, method)
+        for method in ("__getitem__", "__setitem__", "__contains__", "_set_item")
+    )
+
+
+def _restore_user_property_descriptors(user_class: Type[UserObject]) -> None:
+    """
+    Replace the accessors that `user_class` inherits from its superclasses with the
+    original UserProperty descriptors, so that its own item access methods are used.
+    """
+    for base in user_class.__mro__[1:]:
+        for name, user_property in base.__dict__.get(
+            "__json_user_properties__", {}
+        ).items():
+            inherited = next(
+                klass.__dict__[name]
+                for klass in user_class.__mro__
+                if name in klass.__dict__
+            )
+            if isinstance(inherited, property):
+                setattr(user_class, name, user_property)
+
+
+def _check_records(
+    user_class: Type[UserObject], records: Iterable[Mapping[str, Any]]
+) -> Iterator[Tuple[Mapping[str, Any], Optional[Exception]]]:
+    """
+    Validate records against the schema of a UserObject class, yielding a
+    (record, exception) tuple for each of them. The exception is None if the
+    record is valid. Records are validated deeply, including the items of
+    arrays, so that invalid records are found before any objects are created.
+    """
+    validate = user_class.__json_schema__().validate_deep
+    for record in records:
+        try:
+            validate(record)
+        except (ValueError, jsonschema.ValidationError) as e:
+            yield record, e
+        else:
+            yield record, None
+
+
+def _check_record_chunk(
+    user_class: Type[UserObject], records: List[Mapping[str, Any]]
+) -> List[Optional[Exception]]:
+    """
+    Validate a chunk of records in a worker process, returning only the
+    exception (or None) for each record, so that the records themselves do
+    not need to be sent back to the parent process.
+    """
+    return [error for _, error in _check_records(user_class, records)]
+
+
+def _check_records_in_processes(
+    user_class: Type[UserObject],
+    records: Iterable[Mapping[str, Any]],
+    processes: int,
+    chunk_size: int,
+) -> Iterator[Tuple[Mapping[str, Any], Optional[Exception]]]:
+    """
+    Validate records in chunks using a pool of worker processes. Results are
+    yielded in the same order as the records.
+    """
+    records = iter(records)
+    chunks = iter(lambda: list(islice(records, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                (chunk, executor.submit(_check_record_chunk, user_class, chunk))
+            )
+            # Keep a bounded number of chunks in flight
+            if len(pending) > 2 * processes:
+                yield from _chunk_results(*pending.popleft())
+        while pending:
+            yield from _chunk_results(*pending.popleft())
+
+
+def _chunk_results(
+    chunk: List[Mapping[str, Any]], future: Future
+) -> Iterator[Tuple[Mapping[str, Any], Optional[Exception]]]:
+    return zip(chunk, future.result())
@@ -1,8 +1,18 @@
 from typing import Type, Any, Union, Optional, Callable
 
-from ..base_schema import Schema, SchemaPattern
+from time import perf_counter
+
+from .. import instrumentation
+from ..exceptions import ValidationError
+from ..trust import is_trusted, in_batch
+from ..base_schema import Schema, SchemaPattern, SchemaPrimitive
+from ..base_schema.SchemaType import JSON_TYPE_CHECKS
 from ..object_schema import resolve_arg_to_schema
 from ..dom import DOMObject, DOMInfo, document
+from ..dom.DOMElement import _LazyData
+from ..dom.DOMProperties import SCALAR_SCHEMAS
+
+_MISSING = object()
 
 
 class UserProperty(object):
@@ -87,25 +97,131 @@ class UserProperty(object):
         if instance is None:
             raise AttributeError("UserProperty is not valid as a class data descriptor")
         if self.name not in instance:
-            if self.default_function:
-                default_value = self.default_function(instance)
-            else:
-                default_value = self.default
-            if self.persist_defaults:
-                instance[self.name] = default_value
-                return instance[self.name]
-            elif default_value is None:
-                return default_value
-            else:
-                return self.schema_type(
-                    default_value,
-                    DOMInfo(
-                        document=document(instance),
-                        parent=instance,
-                        element_key=self.name,
-                    ),
-                )
+            return self._get_default(instance)
         return instance[self.name]
 
     def __set__(self, instance: DOMObject, value: Any) -> None:
         instance[self.name] = value
+
+    def _get_default(self, instance: DOMObject) -> Any:
+        """
+        Return the value of this property for an instance that does not have a value for it.
+        """
+        if instrumentation._enabled:
+            start = perf_counter()
+            try:
+                return self._compute_default(instance)
+            finally:
+                instrumentation.record(
+                    "default",
+                    f"{instrumentation.class_key(type(instance))}.{self.name}",
+                    perf_counter() - start,
+                )
+        return self._compute_default(instance)
+
+    def _compute_default(self, instance: DOMObject) -> Any:
+        if self.default_function:
+            default_value = self.default_function(instance)
+        else:
+            default_value = self.default
+        if self.persist_defaults:
+            instance[self.name] = default_value
+            return instance[self.name]
+        elif default_value is None:
+            return default_value
+        elif isinstance(self.schema_type, SCALAR_SCHEMAS):
+            return self.schema_type(default_value)
+        else:
+            return self.schema_type(
+                default_value,
+                DOMInfo(
+                    document=document(instance),
+                    parent=instance,
+                    element_key=self.name,
+                ),
+            )
+
+    def _build_accessor(self, owner: Type[DOMObject]) -> property:
+        """
+        Build a property which behaves in the same way as this descriptor for
+        instances of `owner`, but whose getter and setter are specialised for this
+        property's schema and defaults, and which reads and writes the instance's
+        data directly. It is installed on `owner` in place of this descriptor when
+        the class is created.
+
+        :param owner: The :class:`~.wysdom.user_objects.UserObject` subclass that owns this property
+        :return:      A property to install on `owner`
+        """
+        name = self.name
+        property_schema = owner.__json_schema_properties__.properties[name]
+        scalar = isinstance(property_schema, SCALAR_SCHEMAS)
+        get_default = self._get_default
+
+        if not (
+            self.default is not None or self.default_function or self.persist_defaults
+        ):
+            if scalar:
+
+                def get_value(instance: DOMObject) -> Any:
+                    return instance.__json_element_data__.get(name)
+
+            else:
+
+                def get_value(instance: DOMObject) -> Any:
+                    value = instance.__json_element_data__.get(name)
+                    if type(value) is _LazyData:
+                        return instance[name]
+                    return value
+
+        elif scalar:
+
+            def get_value(instance: DOMObject) -> Any:
+                value = instance.__json_element_data__.get(name, _MISSING)
+                if value is _MISSING:
+                    return get_default(instance)
+                return value
+
+        else:
+
+            def get_value(instance: DOMObject) -> Any:
+                value = instance.__json_element_data__.get(name, _MISSING)
+                if value is _MISSING:
+                    return get_default(instance)
+                if type(value) is _LazyData:
+                    return instance[name]
+                return value
+
+        if (
+            type(property_schema) is SchemaPrimitive
+            and property_schema.python_type in SchemaPrimitive.JSON_TYPES
+        ):
+            python_type = property_schema.python_type
+            is_valid = JSON_TYPE_CHECKS[property_schema.type_name]
+
+            def set_value(instance: DOMObject, value: Any) -> None:
+                if value is None:
+                    instance[name] = value
+                    return
+                value = python_type(value)
+                if not (is_valid(value) or is_trusted() or in_batch(instance)):
+                    raise ValidationError(
+                        f"The supplied value does not conform to this schema: {value}"
+                    )
+                instance.__json_element_data__[name] = value
+                instance._element_changed()
+
+        elif scalar:
+
+            def set_value(instance: DOMObject, value: Any) -> None:
+                if value is None:
+                    instance[name] = value
+                else:
+                    instance.__json_element_data__[name] = property_schema(value)
+                    instance._element_changed()
+
+        else:
+
+            def set_value(instance: DOMObject, value: Any) -> None:
+                instance[name] = value
+
+        return property(get_value, set_value)
@@ -2,4 +2,4 @@ from .UserObject import UserObject, UserProperties
 from .UserProperty import UserProperty
 from .ListProperty import ListProperty
 from .DictProperty import DictProperty
-from .functions import properties
+from .functions import properties, schema_definitions
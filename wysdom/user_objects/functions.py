@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict, Iterable, Type
 
 from ..base_schema import Schema
 from .UserObject import UserObject
@@ -13,3 +13,27 @@ def properties(user_object: UserObject) -> Dict[str, Schema]:
     :return:            A dictionary mapping property names to their :class:`~wysdom.base_schema.Schema`
     """
     return user_object.__json_schema_properties__.properties
+
+
+def schema_definitions(user_classes: Iterable[Type[UserObject]]) -> Dict[str, Any]:
+    """
+    Generate a single jsonschema document containing the definitions of a set of
+    :class:`~wysdom.user_objects.UserObject` subclasses and of all of the schemas
+    that they refer to. Other schemas can refer to each of these definitions using
+    `{"$ref": "<document location>#/definitions/<name>"}`.
+
+    :param user_classes: The :class:`~wysdom.user_objects.UserObject` subclasses to include
+    :return:             A jsonschema-compatible dictionary
+    :raises ValueError:  If two different schemas are defined with the same name
+    """
+    definitions = {}
+    for user_class in user_classes:
+        user_schema = user_class.__json_schema__()
+        for name, referenced_schema in user_schema.referenced_schemas.items():
+            definition = referenced_schema.jsonschema_definition
+            if definitions.setdefault(name, definition) != definition:
+                raise ValueError(f"Conflicting schema definitions for {name}.")
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "definitions": dict(sorted(definitions.items())),
+    }